@@ -0,0 +1,190 @@
+# Bounded LRU cache (with optional per-entry TTL) built on the chained HashTable
+import sys
+import time
+
+from Hashtable import HashTable
+
+
+# Define a node class for the recency list
+class CacheNode:
+    # Time = O(1) Space = O(1)
+    def __init__(self, key, value, size, expires_at):
+        self.key = key
+        self.value = value
+        self.size = size # Bytes counted against max_bytes
+        self.expires_at = expires_at # Clock time after which the entry is stale (None = never)
+        self.prev = None
+        self.next = None
+
+
+class LRUCache:
+    # The HashTable maps each key to its CacheNode, and the nodes form a doubly linked list
+    # from most recently used (after head) to least recently used (before tail),
+    # so get, put and evict are all O(1).
+    # max_entries / max_bytes: bounds on the number of entries and on their total size (None = unbounded)
+    # ttl: default seconds an entry stays valid (None = no expiry), put can override it per entry
+    # on_evict: called as on_evict(key, value, reason) with reason 'capacity' or 'expired'
+    # size_of: size of an entry in bytes, called as size_of(key, value)
+    # Keys follow the HashTable rules: strings with at least one alphanumeric character
+    # Time = O(1) Space = O(table_size)
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None, on_evict=None,
+                 size_of=None, clock=time.monotonic, table_size=1024, hash_function='python'):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.size_of = size_of or (lambda key, value: sys.getsizeof(key) + sys.getsizeof(value))
+        self.clock = clock
+        self.table = HashTable(table_size, min_load_factor=0.1, hash_function=hash_function)
+        # Sentinel nodes, so linking and unlinking never check for the ends of the list
+        self.head = CacheNode(None, None, 0, None)
+        self.tail = CacheNode(None, None, 0, None)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0 # Entries dropped to respect max_entries / max_bytes
+        self.expirations = 0 # Entries dropped because their TTL ran out
+
+    def _link_front(self, node):
+        # Time = O(1) Space = O(1)
+        node.prev = self.head
+        node.next = self.head.next
+        self.head.next.prev = node
+        self.head.next = node
+
+    def _unlink(self, node):
+        # Time = O(1) Space = O(1)
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def _remove(self, node, reason=None):
+        # Drop an entry from the table and the list, reporting it to on_evict when reason is given
+        # Time = O(1) Space = O(1)
+        self._unlink(node)
+        self.table.delete(node.key)
+        self.bytes -= node.size
+        if reason == 'capacity':
+            self.evictions += 1
+        elif reason == 'expired':
+            self.expirations += 1
+        if reason is not None and self.on_evict is not None:
+            self.on_evict(node.key, node.value, reason)
+
+    def _over_limit(self):
+        # Time = O(1) Space = O(1)
+        return ((self.max_entries is not None and self.table.curr_size() > self.max_entries) or
+                (self.max_bytes is not None and self.bytes > self.max_bytes))
+
+    def get(self, key, default=None):
+        # Value of a live entry (and mark it most recently used), or default
+        # Time = O(len(k)) Space = O(1)
+        node = self.table.retrieve(key)
+        if node is not None and node.expires_at is not None and self.clock() >= node.expires_at:
+            self._remove(node, 'expired')
+            node = None
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._unlink(node)
+        self._link_front(node)
+        return node.value
+
+    def put(self, key, value, ttl=None):
+        # Insert or replace an entry, then evict least recently used entries until the bounds hold.
+        # Returns False (storing nothing) if the entry alone is larger than max_bytes. A rejected put
+        # still drops any entry already cached under key (without calling on_evict, like delete),
+        # so the key is absent afterwards instead of serving the value the caller meant to replace
+        # Time = O(len(k)) amortized (plus one step per evicted entry) Space = O(1)
+        size = self.size_of(key, value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return False
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+
+        node = self.table.retrieve(key)
+        if node is not None:
+            self._unlink(node)
+            self.bytes += size - node.size
+            node.value, node.size, node.expires_at = value, size, expires_at
+        else:
+            node = CacheNode(key, value, size, expires_at)
+            if not self.table.upsert(key, node):
+                return False # Key without alphanumeric characters
+            self.bytes += size
+        self._link_front(node)
+
+        while self._over_limit() and self.tail.prev is not node:
+            self._remove(self.tail.prev, 'capacity')
+        return True
+
+    def delete(self, key):
+        # Remove an entry without calling on_evict; returns True if it was cached
+        # Time = O(len(k)) Space = O(1)
+        node = self.table.retrieve(key)
+        if node is None:
+            return False
+        self._remove(node)
+        return True
+
+    def purge_expired(self):
+        # Drop every expired entry now instead of when it is next read
+        # Time = O(n) Space = O(1)
+        now = self.clock()
+        node = self.head.next
+        while node is not self.tail:
+            next_node = node.next
+            if node.expires_at is not None and now >= node.expires_at:
+                self._remove(node, 'expired')
+            node = next_node
+
+    def keys(self):
+        # Keys from most to least recently used
+        # Time = O(n) Space = O(n)
+        keys = []
+        node = self.head.next
+        while node is not self.tail:
+            keys.append(node.key)
+            node = node.next
+        return keys
+
+    def stats(self):
+        # Time = O(1) Space = O(1)
+        lookups = self.hits + self.misses
+        return {
+            'entries': self.table.curr_size(),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+    def curr_size(self):
+        # Time = O(1) Space = O(1)
+        return self.table.curr_size()
+
+
+# Demo, run with: python Cache.py
+def main():
+    evicted = []
+    cache = LRUCache(max_entries=3, on_evict=lambda key, value, reason: evicted.append((key, reason)))
+
+    cache.put("Ben", 99)
+    cache.put("Kobbie", 7)
+    cache.put("Timothy", 32)
+    cache.get("Ben") # Ben becomes the most recently used
+    cache.put("Robert", 22) # Evicts Kobbie, the least recently used
+
+    print(f"Keys (most recent first): {cache.keys()}")  # ['Robert', 'Ben', 'Timothy']
+    print(f"Evicted: {evicted}")  # [('Kobbie', 'capacity')]
+    print(f"Get Kobbie: {cache.get('Kobbie')}")  # None
+    print(f"Stats: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
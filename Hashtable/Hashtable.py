@@ -1,4 +1,176 @@
 # Task 1: Implementing Hash data structure from scratch
+import hashlib
+import locale
+import math
+import mmap
+import os
+import pickle
+import re
+import struct
+import sys
+import threading
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
+
+
+# Hash functions used by the hash table
+# Each one takes a key and a seed and returns an integer hash code,
+# or None when the key has no alphanumeric characters (such keys are ignored by the table)
+
+def letter_sum_hash(key, seed=0):
+    # Original scheme: sum of letter positions (anagrams always collide, seed is unused)
+    # Time = O(len(k)) Space = O(1)
+    index = 0
+    found_alphanumeric = False
+
+    # Ensure case insensitivity by converting the key to lower case
+    for character in key.lower():
+        if character.isalnum():  # Process both alphabetic and numeric characters
+            found_alphanumeric = True
+            if character.isalpha():
+                index += ord(character) - ord('a') + 1  # Alphabetic contribution (1 - 26)
+            else:
+                index += ord(character) - ord('0') + 27  # Numeric contribution (numbers start from 27-36)
+
+    # Return the hash value if valid alphanumeric characters are found
+    return index if found_alphanumeric else None
+
+
+FNV_OFFSET_BASIS = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def fnv1a_hash(key, seed=0):
+    # 64-bit FNV-1a over the UTF-8 bytes of the key, stable across processes
+    # Time = O(len(k)) Space = O(len(k))
+    if not any(map(str.isalnum, key)):
+        return None
+    code = FNV_OFFSET_BASIS ^ (seed & MASK_64)
+    for byte in key.encode('utf-8'):
+        code = ((code ^ byte) * FNV_PRIME) & MASK_64
+    return code
+
+
+def python_hash(key, seed=0):
+    # Python's built-in string hash mixed with the seed (fastest, but changes between runs)
+    # Time = O(len(k)) Space = O(1)
+    if not any(map(str.isalnum, key)):
+        return None
+    return hash((seed, key)) & MASK_64
+
+
+def blake2b_hash(key, seed=0):
+    # Keyed 64-bit BLAKE2b digest, stable across processes
+    # Time = O(len(k)) Space = O(len(k))
+    if not any(map(str.isalnum, key)):
+        return None
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8,
+                             key=(seed & MASK_64).to_bytes(8, 'little')).digest()
+    return int.from_bytes(digest, 'little')
+
+
+# Hash functions that can be selected by name
+HASH_FUNCTIONS = {
+    'letter_sum': letter_sum_hash,
+    'fnv1a': fnv1a_hash,
+    'python': python_hash,
+    'blake2b': blake2b_hash,
+}
+
+
+def resolve_hash_function(hash_function):
+    # Look up a hash function by name, or return the callable unchanged
+    # Time = O(1) Space = O(1)
+    if isinstance(hash_function, str):
+        if hash_function not in HASH_FUNCTIONS:
+            raise ValueError(f"Unknown hash function: {hash_function}")
+        return HASH_FUNCTIONS[hash_function]
+    return hash_function
+
+class BloomFilter:
+    # Bit array answering "definitely absent" or "maybe present" for keys, sized from the
+    # expected number of keys and the target false-positive rate.
+    # The k bit positions come from one 64-bit hash code (double hashing), so a table can
+    # reuse the code it already computed for the bucket. Keys cannot be removed
+    # Time = O(m) Space = O(m) (m = number of bits)
+    def __init__(self, expected_count, false_positive_rate=0.01, hash_function='fnv1a', hash_seed=0):
+        expected_count = max(1, expected_count)
+        self.expected_count = expected_count
+        self.false_positive_rate = false_positive_rate
+        self.bit_count = max(8, math.ceil(-expected_count * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / expected_count * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.hash_function = resolve_hash_function(hash_function)
+        self.hash_seed = hash_seed
+        self.added = 0 # add calls, repeats included
+        # Counted by the table, for its lookups only (inserts also check the filter but are not counted)
+        self.rejections = 0 # Lookups answered "definitely absent"
+        self.false_positives = 0 # "Maybe present" answers for keys that turned out absent
+
+    # Bit positions are (first + i * step) % bits for i < hash_count, where first and step are the
+    # two halves of the code after mixing it (so nearby codes still spread over the whole array)
+
+    def add_code(self, code):
+        # Time = O(hash_count) Space = O(1)
+        code = (code * 0x9E3779B97F4A7C15) & MASK_64
+        position, step = code & 0xFFFFFFFF, (code >> 32) | 1
+        bits = self.bits
+        bit_count = self.bit_count
+        for _ in range(self.hash_count):
+            position %= bit_count
+            bits[position >> 3] |= 1 << (position & 7)
+            position += step
+        self.added += 1
+
+    def might_contain_code(self, code):
+        # Time = O(hash_count) Space = O(1)
+        code = (code * 0x9E3779B97F4A7C15) & MASK_64
+        position, step = code & 0xFFFFFFFF, (code >> 32) | 1
+        bits = self.bits
+        bit_count = self.bit_count
+        for _ in range(self.hash_count):
+            position %= bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position += step
+        return True
+
+    def add(self, key):
+        # Time = O(len(k) + hash_count) Space = O(1)
+        code = self.hash_function(key, self.hash_seed)
+        if code is not None:
+            self.add_code(code)
+
+    def might_contain(self, key):
+        # Time = O(len(k) + hash_count) Space = O(1)
+        code = self.hash_function(key, self.hash_seed)
+        return code is not None and self.might_contain_code(code)
+
+    def memory_bytes(self):
+        # Size of the bit array
+        # Time = O(1) Space = O(1)
+        return len(self.bits)
+
+    def stats(self):
+        # Time = O(1) Space = O(1)
+        misses = self.rejections + self.false_positives
+        return {
+            'bits': self.bit_count,
+            'hash_count': self.hash_count,
+            'memory_bytes': self.memory_bytes(),
+            'expected_count': self.expected_count,
+            'target_false_positive_rate': self.false_positive_rate,
+            # Theoretical rate for the number of keys added so far
+            'estimated_false_positive_rate': (1 - math.exp(-self.hash_count * self.added / self.bit_count))
+                                             ** self.hash_count,
+            'rejections': self.rejections,
+            'false_positives': self.false_positives,
+            'measured_false_positive_rate': self.false_positives / misses if misses else 0.0,
+        }
+
 
 # Define a node class for the linked list
 class Node:
@@ -15,6 +187,7 @@ class LinkedList:
     def __init__(self, key, value):
         self.head = Node(key, value)
         self.tail = self.head
+        self.length = 1 # Number of nodes, kept up to date by every operation that links or unlinks one
 
     def exists(self, key):
         # Time = O(n) (number of nodes in the list) Space = O(1)
@@ -33,6 +206,7 @@ class LinkedList:
         # If the node doesn't exist add the node
         if not self.exists(key):
             new_node = Node(key, value) # New node with key and value
+            self.length += 1
             # Append new node into the list and update the tail
             if self.tail:
                 self.tail.next = new_node
@@ -45,44 +219,386 @@ class LinkedList:
 
 class HashTable:
     # Initialize the hash table
+    # max_load_factor: grow (double) the table once count / size goes above it (None disables growing)
+    # min_load_factor: shrink (halve) the table once count / size drops below it (None disables shrinking)
+    # rehash_step: number of old buckets moved into the new table on every operation while resizing
+    # hash_function: a name from HASH_FUNCTIONS or a callable (key, seed) -> int or None
     # Time = O(1) Space = O(n) (n = size of the hash table)
-    def __init__(self, size):
+    def __init__(self, size, max_load_factor=0.75, min_load_factor=None, rehash_step=1,
+                 hash_function='fnv1a', hash_seed=0):
+        self.hash_function = resolve_hash_function(hash_function)
+        self.hash_seed = hash_seed
         self.size = size
         self.table = [None] * size
         self.count = 0 # Track the elements in the hash table
+        self.initial_size = size # The table never shrinks below its initial size
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.rehash_step = rehash_step
+        self.old_table = None # Table being drained while an incremental rehash is in progress
+        self.rehash_index = 0 # Next bucket of the old table to move
+        self.resize_events = [] # (old size, new size, count) of every resize started
+        self.bloom = None # Optional BloomFilter in front of the buckets (see attach_bloom_filter)
+        self.bloom_reuses_code = False # The filter uses the table's hash codes
+        self.bloom_min_chain = 32 # Shortest chain length at which lookups consult the filter
+        self.reset_stats()
+
+    def hash_code(self, key):
+        # Time = O(len(k)) Space = O(1)
+        return self.hash_function(key, self.hash_seed)
 
     def hash(self, key):
         # Time = O(len(k)) Space = O(1)
-        index = 0
-        found_alphanumeric = False
-
-        # Ensure case insensitivity by converting the key to lower case
-        for character in key.lower():
-            if character.isalnum():  # Process both alphabetic and numeric characters
-                found_alphanumeric = True
-                if character.isalpha():
-                    index += ord(character) - ord('a') + 1  # Alphabetic contribution (1 - 26)
-                else:
-                    index += ord(character) - ord('0') + 27  # Numeric contribution (numbers start from 27-36)
+        code = self.hash_code(key)
+        return code % self.size if code is not None else None
+
+    def load_factor(self):
+        # Time = O(1) Space = O(1)
+        return self.count / self.size
+
+    def is_rehashing(self):
+        # Time = O(1) Space = O(1)
+        return self.old_table is not None
+
+    def resize(self, new_size):
+        # Start moving every key into a table of new_size buckets.
+        # The move is spread across the following operations (see rehash_step)
+        # Time = O(new_size) Space = O(new_size)
+        if new_size < 1 or new_size == self.size:
+            return
+        if self.old_table is not None:
+            self.finish_rehash() # Only one rehash can be in progress at a time
+        self.resize_events.append((self.size, new_size, self.count))
+        self.old_table = self.table
+        self.rehash_index = 0
+        self.table = [None] * new_size
+        self.size = new_size
+
+    def finish_rehash(self):
+        # Move all remaining buckets of the old table at once
+        # Time = O(n + m) (old table size plus number of nodes) Space = O(1)
+        while self.old_table is not None:
+            self._rehash_buckets(len(self.old_table))
+
+    def _rehash_buckets(self, steps):
+        # Move up to steps buckets from the old table into the current table
+        # Time = O(steps + m) (m = nodes in the moved buckets) Space = O(1)
+        old_table = self.old_table
+        while steps > 0 and self.rehash_index < len(old_table):
+            entry = old_table[self.rehash_index]
+            if entry is not None:
+                curr = entry.head
+                while curr:
+                    # Keys are unique across both tables, so the node is appended without an exists check
+                    self._append(self.hash(curr.key), curr.key, curr.value)
+                    curr = curr.next
+                old_table[self.rehash_index] = None
+            self.rehash_index += 1
+            steps -= 1
+
+        # Every bucket has been moved, drop the old table
+        if self.rehash_index >= len(old_table):
+            self.old_table = None
+            self.rehash_index = 0
+
+    def _append(self, index, key, value):
+        # Time = O(1) Space = O(1)
+        if self.table[index] is None:
+            self.table[index] = LinkedList(key, value)
+        else:
+            entry = self.table[index]
+            new_node = Node(key, value)
+            entry.tail.next = new_node
+            entry.tail = new_node
+            entry.length += 1
+
+    def _find_node(self, key, code, lookup=False):
+        # Node holding key, looked up with an already computed hash code (None when absent).
+        # While rehashing, the part of the old table not moved yet is checked as well.
+        # An attached Bloom filter is only consulted when the chains to walk hold at least bloom_min_chain
+        # nodes, since a short chain is cheaper to walk than the filter's probes.
+        # lookup: the call answers a retrieve, so the filter's rejections and false positives are counted
+        # Time = O(n) (number of nodes in the chains) Space = O(1)
+        entry = self.table[code % self.size]
+        old_entry = self.old_table[code % len(self.old_table)] if self.old_table is not None else None
+        bloom = self.bloom
+        consulted = False
+        if bloom is not None and ((entry.length if entry is not None else 0) +
+                                  (old_entry.length if old_entry is not None else 0)) >= self.bloom_min_chain:
+            if not (bloom.might_contain_code(code) if self.bloom_reuses_code else bloom.might_contain(key)):
+                if lookup:
+                    bloom.rejections += 1
+                return None
+            consulted = lookup
+        if entry is not None:
+            curr = entry.head
+            while curr:
+                if curr.key == key:
+                    return curr
+                curr = curr.next
+        if old_entry is not None:
+            curr = old_entry.head
+            while curr:
+                if curr.key == key:
+                    return curr
+                curr = curr.next
+        if consulted:
+            bloom.false_positives += 1
+        return None
+
+    def _add_new(self, key, value, code):
+        # Append a key known to be absent and grow the table if needed
+        # Time = O(1) amortized Space = O(1)
+        self._append(code % self.size, key, value)
+        if self.bloom is not None:
+            self._bloom_add(key, code)
+        self.count += 1
+        self._maybe_resize()
+
+    def attach_bloom_filter(self, expected_count=None, false_positive_rate=0.01, hash_function=None,
+                            min_chain=32):
+        # Put a Bloom filter in front of the buckets, sized for expected_count keys
+        # (default: twice the current count or the table size, whichever is larger).
+        # min_chain: lookups consult the filter only when the key's chain holds at least this many nodes.
+        # In CPython one filter check costs about as much as walking 20-30 nodes, so consulting it in front
+        # of short chains slows lookups down; 0 consults it on every lookup.
+        # By default the filter reuses the table's hash codes, so keys are not hashed twice;
+        # with the letter_sum hash (every anagram shares a code) it hashes keys with Python's hash instead.
+        # Keys already in the table are added to it. Deleted keys stay in the filter
+        # Time = O(m + bits) Space = O(bits)
+        if expected_count is None:
+            expected_count = max(2 * self.count, self.size)
+        if hash_function is None:
+            hash_function = 'python' if self.hash_function is letter_sum_hash else self.hash_function
+        bloom = BloomFilter(expected_count, false_positive_rate, hash_function, self.hash_seed)
+        self.bloom = bloom
+        self.bloom_min_chain = min_chain
+        self.bloom_reuses_code = bloom.hash_function is self.hash_function
+        for key, _ in self.items():
+            self._bloom_add(key, self.hash_code(key))
+        return bloom
+
+    def _bloom_add(self, key, code):
+        # Time = O(hash_count) (plus hashing the key when the filter has its own hash) Space = O(1)
+        if self.bloom_reuses_code:
+            self.bloom.add_code(code)
+        else:
+            self.bloom.add(key)
+
+    def _bloom_rejects(self, key, code):
+        # True when the Bloom filter proves the key is absent
+        # Time = O(hash_count) (plus hashing the key when the filter has its own hash) Space = O(1)
+        if self.bloom_reuses_code:
+            return not self.bloom.might_contain_code(code)
+        return not self.bloom.might_contain(key)
+
+    def _chain_length(self, code):
+        # Nodes a lookup of code would walk, in both tables while rehashing
+        # Time = O(1) Space = O(1)
+        length = 0
+        for table in (self.table, self.old_table):
+            if table is not None:
+                entry = table[code % len(table)]
+                if entry is not None:
+                    length += entry.length
+        return length
+
+    def detach_bloom_filter(self):
+        # Time = O(1) Space = O(1)
+        self.bloom = None
 
-        # Return the hash value if valid alphanumeric characters are found
-        return index % self.size if found_alphanumeric else None
+    def _maybe_resize(self):
+        # Grow or shrink the table once the load factor crosses a threshold
+        # Time = O(size) when a resize starts, O(1) otherwise Space = O(size)
+        if self.old_table is not None:
+            return # Wait for the current rehash to finish
+        load = self.count / self.size
+        if self.max_load_factor is not None and load > self.max_load_factor:
+            self.resize(self.size * 2)
+        elif (self.min_load_factor is not None and load < self.min_load_factor
+              and self.size // 2 >= self.initial_size):
+            self.resize(self.size // 2)
 
     def insert(self, key, value):
+        # Duplicate keys are ignored (the stored value is kept)
         # Time = O(len(k) + n) Space = O(1)
-        index = self.hash(key)
-        if index is not None:
-            if self.table[index] is None:
-                self.table[index] = LinkedList(key, value)
-                self.count += 1
+        self.setdefault(key, value)
+
+    def upsert(self, key, value):
+        # Insert the key or overwrite its value; returns True if the key was new.
+        # The key is hashed once and its chain walked once
+        # Time = O(len(k) + n) Space = O(1)
+        if self.old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+        code = self.hash_code(key)
+        if code is None:
+            return False
+        node = self._find_node(key, code)
+        if node is not None:
+            node.value = value
+            return False
+        self._add_new(key, value, code)
+        return True
+
+    def setdefault(self, key, default=None):
+        # Return the stored value, inserting default first if the key is absent
+        # (None for keys without alphanumeric characters, which are never stored)
+        # Time = O(len(k) + n) Space = O(1)
+        if self.old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+        code = self.hash_code(key)
+        if code is None:
+            return None
+        node = self._find_node(key, code)
+        if node is not None:
+            return node.value
+        self._add_new(key, default, code)
+        return default
+
+    def get_or_insert(self, key, factory):
+        # Like setdefault, but the value is only built (factory()) when the key is absent
+        # Time = O(len(k) + n) Space = O(1)
+        if self.old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+        code = self.hash_code(key)
+        if code is None:
+            return None
+        node = self._find_node(key, code)
+        if node is not None:
+            return node.value
+        value = factory()
+        self._add_new(key, value, code)
+        return value
+
+    def delete(self, key):
+        # Remove the key; returns True if it was present. The table may shrink afterwards
+        # Time = O(len(k) + n) Space = O(1)
+        if self.old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+        code = self.hash_code(key)
+        if code is None:
+            return False
+        tables = [self.table]
+        if self.old_table is not None:
+            tables.append(self.old_table)
+        for table in tables:
+            index = code % len(table)
+            entry = table[index]
+            if entry is None:
+                continue
+            prev = None
+            curr = entry.head
+            while curr:
+                if curr.key == key:
+                    # Unlink the node and fix the head and tail of the chain
+                    if prev is None:
+                        entry.head = curr.next
+                    else:
+                        prev.next = curr.next
+                    if entry.tail is curr:
+                        entry.tail = prev
+                    entry.length -= 1
+                    if entry.head is None:
+                        table[index] = None # Empty chain
+                    self.count -= 1
+                    self._maybe_resize()
+                    return True
+                prev = curr
+                curr = curr.next
+        return False
+
+    def insert_many(self, pairs):
+        # Insert (key, value) pairs (or a dict's items) in bulk; duplicate keys keep the first value.
+        # The table is grown once up front, the distinct keys are hashed in one batch and grouped
+        # by bucket, and each bucket's chain is walked once for all of its new keys.
+        # Returns the number of keys added
+        # Time = O(b + sum of len(k) + n) Space = O(b) (b = number of pairs)
+        if isinstance(pairs, dict):
+            pairs = pairs.items()
+        batch = {}
+        for key, value in pairs:
+            if key not in batch:
+                batch[key] = value
+
+        # Grow straight to the size that keeps the load under the threshold, then group against that table
+        if self.max_load_factor is not None:
+            new_size = self.size
+            while (self.count + len(batch)) / new_size > self.max_load_factor:
+                new_size *= 2
+            self.resize(new_size)
+        self.finish_rehash()
+
+        size = self.size
+        bloom = self.bloom
+        groups = {}
+        for key, code in zip(batch, map(self.hash_function, batch, repeat(self.hash_seed))):
+            if code is not None:
+                if bloom is not None:
+                    self._bloom_add(key, code) # Harmless for keys that are already present
+                index = code % size
+                group = groups.get(index)
+                if group is None:
+                    groups[index] = [key]
+                else:
+                    group.append(key)
+
+        added = 0
+        table = self.table
+        for index, group in groups.items():
+            entry = table[index]
+            if entry is None:
+                # The first key starts the chain
+                entry = table[index] = LinkedList(group[0], batch[group[0]])
+                new_keys = group[1:]
+                added += 1
             else:
-                if not self.table[index].exists(key):  # Check for existing key before adding
-                    self.table[index].add(key, value)
-                    self.count += 1  # Increment when new key is added
+                present = set()
+                curr = entry.head
+                while curr:
+                    present.add(curr.key)
+                    curr = curr.next
+                new_keys = [key for key in group if key not in present]
+            # Link the new nodes onto the tail of the chain
+            tail = entry.tail
+            for key in new_keys:
+                tail.next = Node(key, batch[key])
+                tail = tail.next
+            entry.tail = tail
+            entry.length += len(new_keys)
+            added += len(new_keys)
+        self.count += added
+        return added
+
+    def retrieve_many(self, keys):
+        # Values for a batch of keys, in order (None for missing keys).
+        # Each distinct key is hashed and looked up once, however often it repeats in the batch.
+        # Like retrieve, it advances a rehash in progress by one step only and looks keys up in both tables
+        # Time = O(b + sum of len(k) + n) Space = O(b) (b = number of keys)
+        keys = list(keys)
+        if self.old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+        find_node = self._find_node
+        found = {}
+        unique = dict.fromkeys(keys)
+        for key, code in zip(unique, map(self.hash_function, unique, repeat(self.hash_seed))):
+            if code is not None:
+                node = find_node(key, code, True)
+                if node is not None:
+                    found[key] = node.value
+        return [found.get(key) for key in keys]
 
     def print_hashtable(self):
         # Time = O(n + m) (table size plus number of nodes)
         # Space = O(1)
+        # Entries not yet moved out of the old table are printed first
+        if self.old_table is not None:
+            for i, entry in enumerate(self.old_table):
+                if entry is not None:
+                    curr = entry.head
+                    while curr:
+                        print(f"Old index: {i}, Key: {curr.key}, Value: {curr.value}")
+                        curr = curr.next
+
         # Iterate over each index and entry in the hash table
         for i, entry in enumerate(self.table):
             if entry is not None: # If entry present at index
@@ -107,93 +623,997 @@ class HashTable:
 
     def retrieve(self, key):
         # Time = O(len(k) + n) Space = O(1)
-        index = self.hash(key)
-        if index is None or self.table[index] is None:
+        if self.old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+        code = self.hash_code(key)
+        if code is None:
+            return None
+        node = self._find_node(key, code, lookup=True)
+        return node.value if node is not None else None
+
+    def items(self):
+        # Iterate over the (key, value) pairs, including any not yet moved out of the old table
+        # Time = O(n + m) Space = O(1)
+        for table in (self.old_table or [], self.table):
+            for entry in table:
+                if entry is not None:
+                    curr = entry.head
+                    while curr:
+                        yield curr.key, curr.value
+                        curr = curr.next
+
+    def enable_stats(self):
+        # Count the probes (key comparisons) of every retrieve call from now on.
+        # retrieve is swapped for a counting version on this instance, so a table
+        # without stats enabled runs the plain method with no counter overhead
+        # Time = O(1) Space = O(1)
+        self.reset_stats()
+        self.retrieve = self._retrieve_counted
+
+    def disable_stats(self):
+        # Time = O(1) Space = O(1)
+        self.__dict__.pop('retrieve', None)
+
+    def reset_stats(self):
+        # Time = O(1) Space = O(1)
+        self.successful_lookups = 0
+        self.successful_probes = 0
+        self.unsuccessful_lookups = 0
+        self.unsuccessful_probes = 0
+
+    def _retrieve_counted(self, key):
+        # retrieve, also counting lookups and probes (installed by enable_stats)
+        # Time = O(len(k) + n) Space = O(1)
+        if self.old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+        code = self.hash_code(key)
+        if code is None:
+            return None
+        probes = 0
+        bloom = self.bloom
+        consulted = bloom is not None and self._chain_length(code) >= self.bloom_min_chain
+        if consulted and self._bloom_rejects(key, code):
+            bloom.rejections += 1
+            self.unsuccessful_lookups += 1 # Rejected by the Bloom filter without a probe
+            return None
+        for table in (self.table, self.old_table):
+            if table is None:
+                continue
+            entry = table[code % len(table)]
+            if entry is not None:
+                curr = entry.head
+                while curr:
+                    probes += 1
+                    if curr.key == key:
+                        self.successful_lookups += 1
+                        self.successful_probes += probes
+                        return curr.value
+                    curr = curr.next
+        if consulted:
+            bloom.false_positives += 1
+        self.unsuccessful_lookups += 1
+        self.unsuccessful_probes += probes
+        return None
+
+    def stats(self):
+        # Summary of the table's shape and, once enable_stats was called, of its retrieve calls.
+        # Only counts are returned, so it stays cheap to read on tables of any size
+        # Time = O(n + m) Space = O(longest chain)
+        histogram = {0: 0} # chain length -> number of buckets
+        for table in (self.old_table or [], self.table):
+            for entry in table:
+                length = 0
+                curr = entry.head if entry is not None else None
+                while curr:
+                    length += 1
+                    curr = curr.next
+                histogram[length] = histogram.get(length, 0) + 1
+        if self.old_table is not None:
+            # Buckets already moved out of the old table are not part of either table
+            histogram[0] -= self.rehash_index
+        occupied = sum(buckets for length, buckets in histogram.items() if length)
+        return {
+            'size': self.size,
+            'count': self.count,
+            'load_factor': self.count / self.size,
+            'occupied_buckets': occupied,
+            'chain_length_histogram': dict(sorted(histogram.items())),
+            'max_chain': max(histogram),
+            'average_chain': self.count / occupied if occupied else 0.0,
+            'successful_lookups': self.successful_lookups,
+            'average_probes_successful': (self.successful_probes / self.successful_lookups
+                                          if self.successful_lookups else 0.0),
+            'unsuccessful_lookups': self.unsuccessful_lookups,
+            'average_probes_unsuccessful': (self.unsuccessful_probes / self.unsuccessful_lookups
+                                            if self.unsuccessful_lookups else 0.0),
+            'resize_events': list(self.resize_events),
+            'rehashing': self.old_table is not None,
+        }
+
+    def save(self, path):
+        # Write the table to a binary snapshot that HashTable.load can memory-map.
+        # Layout (little endian):
+        #   header: magic, version, hash function name length, bucket count, key count, hash seed
+        #   hash function name (UTF-8)
+        #   bucket offset array: bucket count + 1 offsets of each bucket's first record
+        #   records, grouped by bucket: key length, value length, UTF-8 key, pickled value
+        # Only hash functions that give the same codes in every process can be saved
+        # Time = O(n + m) Space = O(n)
+        name = next((name for name, function in HASH_FUNCTIONS.items() if function is self.hash_function), None)
+        if name is None or name == 'python':
+            raise ValueError("Snapshots need a stable named hash function (e.g. 'fnv1a')")
+        self.finish_rehash() # Every key sits in the bucket its code points to
+        name_bytes = name.encode('utf-8')
+        records_start = SNAPSHOT_HEADER.size + len(name_bytes) + 8 * (self.size + 1)
+
+        offsets = array('Q', [0]) * (self.size + 1)
+        with open(path, 'wb') as file:
+            file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(name_bytes), self.size,
+                                            self.count, self.hash_seed & MASK_64))
+            file.write(name_bytes)
+            file.seek(records_start)
+            position = records_start
+            for index, entry in enumerate(self.table):
+                offsets[index] = position
+                curr = entry.head if entry is not None else None
+                while curr:
+                    key_bytes = curr.key.encode('utf-8')
+                    value_bytes = pickle.dumps(curr.value, protocol=pickle.HIGHEST_PROTOCOL)
+                    file.write(SNAPSHOT_RECORD.pack(len(key_bytes), len(value_bytes)))
+                    file.write(key_bytes)
+                    file.write(value_bytes)
+                    position += SNAPSHOT_RECORD.size + len(key_bytes) + len(value_bytes)
+                    curr = curr.next
+            offsets[self.size] = position
+
+            # Fill in the bucket offset array now that every record position is known
+            if sys.byteorder == 'big':
+                offsets.byteswap()
+            file.seek(SNAPSHOT_HEADER.size + len(name_bytes))
+            file.write(offsets.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        # Open a snapshot written by save as a read-only, memory-mapped HashTableSnapshot.
+        # Nothing is deserialised up front, so lookups can start right away
+        # Time = O(1) Space = O(1)
+        return HashTableSnapshot(path)
+
+    def curr_size(self):
+        # Time = O(1) Space = O(1)
+        return self.count
+
+
+# Binary snapshot layout used by HashTable.save and HashTableSnapshot
+SNAPSHOT_MAGIC = b'HTSNAP\x00\x01'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<8sIIQQQ') # magic, version, name length, buckets, count, seed
+SNAPSHOT_RECORD = struct.Struct('<II') # key length, value length
+SNAPSHOT_OFFSET = struct.Struct('<QQ') # start of a bucket and start of the next one
+
+
+class HashTableSnapshot:
+    # Read-only view of a table saved with HashTable.save, backed by a memory-mapped file.
+    # A lookup hashes the key, reads its bucket's two offsets and scans only that bucket's
+    # records; values are unpickled when they are retrieved (only load trusted snapshots).
+    # Time = O(1) Space = O(1)
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, name_length, self.size, self.count, self.hash_seed = \
+                SNAPSHOT_HEADER.unpack_from(self.data, 0)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                raise ValueError(f"{path} is not a hash table snapshot")
+            name_start = SNAPSHOT_HEADER.size
+            self.hash_function_name = self.data[name_start:name_start + name_length].decode('utf-8')
+            self.hash_function = resolve_hash_function(self.hash_function_name)
+            self.offsets_start = name_start + name_length
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        # Time = O(1) Space = O(1)
+        if getattr(self, 'data', None) is not None:
+            self.data.close()
+            self.data = None
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def retrieve(self, key):
+        # Time = O(len(k) + n) (n = records in the key's bucket) Space = O(1)
+        code = self.hash_function(key, self.hash_seed)
+        if code is None:
             return None
-        curr = self.table[index].head
+        data = self.data
+        position, end = SNAPSHOT_OFFSET.unpack_from(data, self.offsets_start + 8 * (code % self.size))
+        key_bytes = key.encode('utf-8')
+        while position < end:
+            key_length, value_length = SNAPSHOT_RECORD.unpack_from(data, position)
+            key_start = position + SNAPSHOT_RECORD.size
+            value_start = key_start + key_length
+            if key_length == len(key_bytes) and data[key_start:value_start] == key_bytes:
+                return pickle.loads(data[value_start:value_start + value_length])
+            position = value_start + value_length
+        return None
+
+    def items(self):
+        # Iterate over the (key, value) pairs in bucket order
+        # Time = O(n + m) Space = O(1)
+        data = self.data
+        position = SNAPSHOT_OFFSET.unpack_from(data, self.offsets_start)[0]
+        end = SNAPSHOT_OFFSET.unpack_from(data, self.offsets_start + 8 * (self.size - 1))[1]
+        while position < end:
+            key_length, value_length = SNAPSHOT_RECORD.unpack_from(data, position)
+            key_start = position + SNAPSHOT_RECORD.size
+            value_start = key_start + key_length
+            yield data[key_start:value_start].decode('utf-8'), pickle.loads(data[value_start:value_start + value_length])
+            position = value_start + value_length
+
+    def to_hashtable(self):
+        # Mutable HashTable with the same buckets, hash function and contents
+        # Time = O(n + m) Space = O(n + m)
+        hash_table = HashTable(self.size, hash_function=self.hash_function, hash_seed=self.hash_seed)
+        hash_table.insert_many(self.items())
+        return hash_table
+
+    def curr_size(self):
+        # Time = O(1) Space = O(1)
+        return self.count
+
+
+class ConcurrentHashTable:
+    # Thread-safe chained hash table using lock striping: bucket i is guarded by lock i % stripes,
+    # so operations on buckets of different stripes never wait for each other (retrieve included).
+    # The count is kept per stripe and only changed under that stripe's lock, so no insert is lost.
+    # Resizing takes every stripe lock (in order, so it cannot deadlock) and rebuilds the buckets at once
+    # Time = O(n) Space = O(n) (n = size of the hash table)
+    def __init__(self, size, stripes=16, max_load_factor=0.75, hash_function='fnv1a', hash_seed=0):
+        self.size = size
+        self.table = [None] * size
+        self.stripes = stripes
+        self.locks = [threading.Lock() for _ in range(stripes)]
+        self.stripe_counts = [0] * stripes # Keys added minus keys deleted under each lock
+        self.max_load_factor = max_load_factor
+        self.hash_function = resolve_hash_function(hash_function)
+        self.hash_seed = hash_seed
+
+    def _locked_bucket(self, code):
+        # Acquire the stripe lock of the key's bucket and return (index, stripe).
+        # The size is checked again once the lock is held, in case a resize ran in between
+        # Time = O(1) expected Space = O(1)
+        while True:
+            size = self.size
+            index = code % size
+            stripe = index % self.stripes
+            self.locks[stripe].acquire()
+            if self.size == size:
+                return index, stripe
+            self.locks[stripe].release()
+
+    def _find_node(self, index, key):
+        # Time = O(n) (number of nodes in the chain) Space = O(1)
+        entry = self.table[index]
+        curr = entry.head if entry is not None else None
         while curr:
             if curr.key == key:
-                return curr.value
+                return curr
             curr = curr.next
         return None
 
+    def _add(self, key, value, overwrite):
+        # Shared body of insert, upsert and setdefault; returns (stored value, added)
+        # Time = O(len(k) + n) amortized Space = O(1) amortized
+        code = self.hash_function(key, self.hash_seed)
+        if code is None:
+            return None, False
+        index, stripe = self._locked_bucket(code)
+        try:
+            node = self._find_node(index, key)
+            if node is not None:
+                if overwrite:
+                    node.value = value
+                return node.value, False
+            entry = self.table[index]
+            if entry is None:
+                self.table[index] = LinkedList(key, value)
+            else:
+                new_node = Node(key, value)
+                entry.tail.next = new_node
+                entry.tail = new_node
+                entry.length += 1
+            self.stripe_counts[stripe] += 1
+            size = self.size
+        finally:
+            self.locks[stripe].release()
+        # Resize outside the stripe lock, since resizing needs every lock
+        if self.max_load_factor is not None and self.curr_size() > self.max_load_factor * size:
+            self._resize(size, size * 2)
+        return value, True
+
+    def insert(self, key, value):
+        # Duplicate keys are ignored (the stored value is kept)
+        # Time = O(len(k) + n) Space = O(1)
+        self._add(key, value, overwrite=False)
+
+    def upsert(self, key, value):
+        # Insert the key or overwrite its value; returns True if the key was new
+        # Time = O(len(k) + n) Space = O(1)
+        return self._add(key, value, overwrite=True)[1]
+
+    def setdefault(self, key, default=None):
+        # Return the stored value, inserting default first if the key is absent
+        # Time = O(len(k) + n) Space = O(1)
+        return self._add(key, default, overwrite=False)[0]
+
+    def retrieve(self, key):
+        # Only the key's stripe is locked, so writers to other stripes never block it
+        # Time = O(len(k) + n) Space = O(1)
+        code = self.hash_function(key, self.hash_seed)
+        if code is None:
+            return None
+        index, stripe = self._locked_bucket(code)
+        try:
+            node = self._find_node(index, key)
+            return node.value if node is not None else None
+        finally:
+            self.locks[stripe].release()
+
+    def delete(self, key):
+        # Remove the key; returns True if it was present
+        # Time = O(len(k) + n) Space = O(1)
+        code = self.hash_function(key, self.hash_seed)
+        if code is None:
+            return False
+        index, stripe = self._locked_bucket(code)
+        try:
+            entry = self.table[index]
+            prev = None
+            curr = entry.head if entry is not None else None
+            while curr:
+                if curr.key == key:
+                    if prev is None:
+                        entry.head = curr.next
+                    else:
+                        prev.next = curr.next
+                    if entry.tail is curr:
+                        entry.tail = prev
+                    entry.length -= 1
+                    if entry.head is None:
+                        self.table[index] = None
+                    self.stripe_counts[stripe] -= 1
+                    return True
+                prev = curr
+                curr = curr.next
+            return False
+        finally:
+            self.locks[stripe].release()
+
+    def _resize(self, expected_size, new_size):
+        # Rebuild the buckets at new_size while holding every stripe lock.
+        # Skipped if another thread already resized the table from expected_size
+        # Time = O(n + m) Space = O(new_size)
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            if self.size != expected_size:
+                return
+            old_table = self.table
+            self.table = [None] * new_size
+            for entry in old_table:
+                curr = entry.head if entry is not None else None
+                while curr:
+                    index = self.hash_function(curr.key, self.hash_seed) % new_size
+                    if self.table[index] is None:
+                        self.table[index] = LinkedList(curr.key, curr.value)
+                    else:
+                        new_node = Node(curr.key, curr.value)
+                        self.table[index].tail.next = new_node
+                        self.table[index].tail = new_node
+                        self.table[index].length += 1
+                    curr = curr.next
+            self.size = new_size
+        finally:
+            for lock in reversed(self.locks):
+                lock.release()
+
+    def items(self):
+        # Consistent list of the (key, value) pairs, taken while holding every stripe lock
+        # Time = O(n + m) Space = O(m)
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            pairs = []
+            for entry in self.table:
+                curr = entry.head if entry is not None else None
+                while curr:
+                    pairs.append((curr.key, curr.value))
+                    curr = curr.next
+            return pairs
+        finally:
+            for lock in reversed(self.locks):
+                lock.release()
+
     def curr_size(self):
+        # Time = O(stripes) Space = O(1)
+        return sum(self.stripe_counts)
+
+
+# Marks a slot whose entry was deleted (probing continues past it)
+_TOMBSTONE = object()
+
+
+class FlatHashTable:
+    # Open-addressing hash table with the same insert/retrieve/curr_size API as HashTable.
+    # Keys, values and cached hash codes are stored in three parallel flat arrays, so there is
+    # no Node or LinkedList object per entry. Collisions use linear probing with Robin Hood
+    # insertion (an entry far from its home slot takes the place of one closer to home),
+    # and deleted entries leave a tombstone behind.
+    # Time = O(n) Space = O(n) (n = capacity, the next power of two >= size)
+    def __init__(self, size, max_load_factor=0.7, hash_function='fnv1a', hash_seed=0, robin_hood=True):
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        self.hash_function = resolve_hash_function(hash_function)
+        self.hash_seed = hash_seed
+        self.max_load_factor = max_load_factor
+        self.robin_hood = robin_hood
+        self.count = 0 # Live entries
+        self.tombstones = 0 # Deleted slots not reused yet
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        # Time = O(capacity) Space = O(capacity)
+        self.capacity = capacity
+        self.keys = [None] * capacity # None marks an empty slot
+        self.values = [None] * capacity
+        self.hashes = array('Q', bytes(8 * capacity)) # Cached 64-bit hash codes
+
+    def hash_code(self, key):
+        # Time = O(len(k)) Space = O(1)
+        code = self.hash_function(key, self.hash_seed)
+        return code & MASK_64 if code is not None else None
+
+    def load_factor(self):
         # Time = O(1) Space = O(1)
-        return self.count
+        return self.count / self.capacity
 
+    def _find_slot(self, key, code):
+        # Slot holding key, or -1 if the key is absent (probing stops at the first empty slot)
+        # Time = O(probe length) Space = O(1)
+        keys = self.keys
+        hashes = self.hashes
+        mask = self.capacity - 1
+        slot = code & mask
+        while True:
+            slot_key = keys[slot]
+            if slot_key is None:
+                return -1
+            # Compare the cached hash first so most mismatches skip the key comparison
+            if slot_key is not _TOMBSTONE and hashes[slot] == code and slot_key == key:
+                return slot
+            slot = (slot + 1) & mask
 
-# Task 1 Test Case
-print('-------task 1--------')
-hash_table = HashTable(10)
+    def _place(self, key, value, code):
+        # Store an entry known to be absent
+        # Time = O(probe length) Space = O(1)
+        keys = self.keys
+        values = self.values
+        hashes = self.hashes
+        mask = self.capacity - 1
+        slot = code & mask
+        distance = 0 # How far the carried entry is from its home slot
+        while True:
+            slot_key = keys[slot]
+            if slot_key is None or slot_key is _TOMBSTONE:
+                if slot_key is _TOMBSTONE:
+                    self.tombstones -= 1
+                keys[slot] = key
+                values[slot] = value
+                hashes[slot] = code
+                return
+            if self.robin_hood:
+                slot_distance = (slot - (hashes[slot] & mask)) & mask
+                if slot_distance < distance:
+                    # Take the slot from the entry closer to home and carry that entry forward
+                    keys[slot], key = key, slot_key
+                    values[slot], value = value, values[slot]
+                    hashes[slot], code = code, hashes[slot]
+                    distance = slot_distance
+            slot = (slot + 1) & mask
+            distance += 1
 
-# Initialize an empty HashTable
-print(f'Initialize an empty HashTable: {hash_table.curr_size()}')  # Output: 0
+    def _resize(self):
+        # Rebuild the arrays, doubling the capacity unless dropping the tombstones frees enough room.
+        # Cached hash codes are reused, so no key is hashed again
+        # Time = O(n) Space = O(n)
+        keys, values, hashes = self.keys, self.values, self.hashes
+        capacity = self.capacity
+        if self.count + 1 > self.max_load_factor * capacity / 2:
+            capacity *= 2
+        self._allocate(capacity)
+        self.tombstones = 0
+        for slot, key in enumerate(keys):
+            if key is not None and key is not _TOMBSTONE:
+                self._place(key, values[slot], hashes[slot])
 
-# Insert alpha keys into the HashTable
-hash_table.insert("Ben", "99")
-hash_table.insert("Kobbie", "7")
-hash_table.insert("Timothy", "32")
-hash_table.insert("Robert", "22")
-hash_table.insert("Bander", "11")
-hash_table.insert("Trent", "87")
+    def _add_new(self, key, value, code):
+        # Store a key known to be absent, rebuilding the arrays first if needed
+        # Time = O(probe length) amortized Space = O(1) amortized
+        # Tombstones count towards the load since probing has to walk over them
+        if self.count + self.tombstones + 1 > self.max_load_factor * self.capacity:
+            self._resize()
+        self._place(key, value, code)
+        self.count += 1
 
-hash_table.print_hashtable()
+    def insert(self, key, value):
+        # Duplicate keys are ignored, like HashTable.insert
+        # Time = O(len(k) + probe length) amortized Space = O(1) amortized
+        self.setdefault(key, value)
 
-print(f'HashTable size after adding alphanumeric keys: {hash_table.curr_size()}')  # Output: 6
+    def upsert(self, key, value):
+        # Insert the key or overwrite its value; returns True if the key was new
+        # Time = O(len(k) + probe length) amortized Space = O(1) amortized
+        code = self.hash_code(key)
+        if code is None:
+            return False
+        slot = self._find_slot(key, code)
+        if slot >= 0:
+            self.values[slot] = value
+            return False
+        self._add_new(key, value, code)
+        return True
 
-# Display that collisions are handled properly
-print("\nContent at Index 4:")
-hash_table.print_index(4)
+    def setdefault(self, key, default=None):
+        # Return the stored value, inserting default first if the key is absent
+        # Time = O(len(k) + probe length) amortized Space = O(1) amortized
+        code = self.hash_code(key)
+        if code is None:
+            return None
+        slot = self._find_slot(key, code)
+        if slot >= 0:
+            return self.values[slot]
+        self._add_new(key, default, code)
+        return default
 
-# Insert non-alpha key (ignored by hash function)
-hash_table.insert("@#?!", "Non-alphanumeric key value")
-print(f'\nHashTable size after attempting to add Non-alphanumeric key: {hash_table.curr_size()}')  # Output: 6
+    def get_or_insert(self, key, factory):
+        # Like setdefault, but the value is only built (factory()) when the key is absent
+        # Time = O(len(k) + probe length) amortized Space = O(1) amortized
+        code = self.hash_code(key)
+        if code is None:
+            return None
+        slot = self._find_slot(key, code)
+        if slot >= 0:
+            return self.values[slot]
+        value = factory()
+        self._add_new(key, value, code)
+        return value
 
-# Prevent duplicate entries
-hash_table.insert("Ben", "99")
-print(f'HashTable size after attempting to add a duplicate: {hash_table.curr_size()}')  # Output: 6
+    def retrieve(self, key):
+        # Time = O(len(k) + probe length) Space = O(1)
+        code = self.hash_code(key)
+        if code is None:
+            return None
+        slot = self._find_slot(key, code)
+        return self.values[slot] if slot >= 0 else None
+
+    def delete(self, key):
+        # Replace the entry with a tombstone; returns True if the key was present
+        # Time = O(len(k) + probe length) Space = O(1)
+        code = self.hash_code(key)
+        if code is None:
+            return False
+        slot = self._find_slot(key, code)
+        if slot < 0:
+            return False
+        self.keys[slot] = _TOMBSTONE
+        self.values[slot] = None
+        self.count -= 1
+        self.tombstones += 1
+        return True
+
+    def insert_many(self, pairs):
+        # Insert (key, value) pairs (or a dict's items) in bulk, hashing the keys in one batch.
+        # Duplicate keys keep the first value. Returns the number of keys added
+        # Time = O(b + sum of len(k)) amortized Space = O(b) (b = number of pairs)
+        if isinstance(pairs, dict):
+            pairs = pairs.items()
+        pairs = list(pairs)
+        keys = [pair[0] for pair in pairs]
+        added = 0
+        for (key, value), code in zip(pairs, map(self.hash_function, keys, repeat(self.hash_seed))):
+            if code is not None:
+                code &= MASK_64
+                if self._find_slot(key, code) < 0:
+                    self._add_new(key, value, code)
+                    added += 1
+        return added
+
+    def items(self):
+        # Iterate over the (key, value) pairs
+        # Time = O(n) Space = O(1)
+        for slot, key in enumerate(self.keys):
+            if key is not None and key is not _TOMBSTONE:
+                yield key, self.values[slot]
+
+    def print_hashtable(self):
+        # Time = O(n) Space = O(1)
+        for key, value in self.items():
+            print(f"Index: {self._find_slot(key, self.hash_code(key))}, Key: {key}, Value: {value}")
 
-# Retrieve values that are both present and not present in the list
-print(f'\nRetrieve Ben: {hash_table.retrieve("Ben")}') # Value: 99
-# Testing to retrieve a key that doesn't exist in the list
-print(f'Retrieve non-existent key: {hash_table.retrieve("nonexistent")}')  # Output: None
+    def curr_size(self):
+        # Time = O(1) Space = O(1)
+        return self.count
 
 
 # Task 2:
-def parse_and_insert_anagram_roots(file_path, hash_table):
+# Translation table for ASCII text: letters and digits are kept (lower case), every other byte becomes a space
+_ASCII_WORD_TABLE = bytes(
+    code + 32 if 65 <= code <= 90 else code if 48 <= code <= 57 or 97 <= code <= 122 else 32
+    for code in range(256)
+)
+# Runs of alphanumeric characters (same characters as str.isalnum, the underscore excluded)
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+
+
+def _chunk_words(chunk, encoding):
+    # Lower case words of a chunk of bytes that ends on a line boundary
+    # Time = O(len(chunk)) Space = O(len(chunk))
+    if chunk.isascii():
+        # Fast path: one translate, one decode and one split for the whole chunk
+        return chunk.translate(_ASCII_WORD_TABLE).decode('ascii').split()
+    return _WORD_PATTERN.findall(chunk.decode(encoding).lower())
+
+
+def _mapped_chunks(data, start, end, chunk_size):
+    # Slices of a memory-mapped file of about chunk_size bytes, cut after a newline
+    # Time = O(end - start) Space = O(chunk_size)
+    while start < end:
+        stop = min(start + chunk_size, end)
+        if stop < end:
+            newline = data.rfind(b'\n', start, stop)
+            if newline < 0: # Line longer than chunk_size
+                newline = data.find(b'\n', stop, end)
+            stop = newline + 1 if newline >= 0 else end
+        yield data[start:stop]
+        start = stop
+
+
+def _buffered_chunks(file, start, end, chunk_size):
+    # Blocks of about chunk_size bytes read from the file, cut after a newline
+    # Time = O(end - start) Space = O(chunk_size)
+    file.seek(start)
+    remaining = end - start
+    carry = b'' # Partial last line of the previous block
+    while remaining > 0:
+        block = file.read(min(chunk_size, remaining))
+        if not block:
+            break
+        remaining -= len(block)
+        block = carry + block
+        carry = b''
+        if remaining > 0:
+            newline = block.rfind(b'\n')
+            if newline < 0:
+                carry = block
+                continue
+            carry = block[newline + 1:]
+            block = block[:newline + 1]
+        yield block
+    if carry:
+        yield carry
+
+
+def iter_words(file_path, start=0, end=None, chunk_size=1 << 20, encoding=None, use_mmap=True):
+    # Stream the lower case alphanumeric words of a file (or of the byte range start:end).
+    # The file is memory-mapped (or read in large blocks) and normalised a chunk at a time,
+    # giving the same words as splitting every line on non-alphanumeric characters.
+    # encoding defaults to the one open(file_path, 'r') uses and must be ASCII compatible (e.g. UTF-8)
+    # Time = O(file size) Space = O(chunk_size)
+    encoding = encoding or locale.getpreferredencoding(False)
+    with open(file_path, 'rb') as file:
+        file_size = os.fstat(file.fileno()).st_size
+        end = file_size if end is None else min(end, file_size)
+        if start >= end:
+            return # Also avoids mapping an empty file
+        if use_mmap:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for chunk in _mapped_chunks(data, start, end, chunk_size):
+                    yield from _chunk_words(chunk, encoding)
+        else:
+            for chunk in _buffered_chunks(file, start, end, chunk_size):
+                yield from _chunk_words(chunk, encoding)
+
+
+# Anagram signature functions: every word gets a string key (its anagram root) shared only by its anagrams
+
+def sorted_signature(word):
+    # The word's characters in sorted order
+    # Time = O(k log k) Space = O(k)
+    return ''.join(sorted(word))
+
+
+def letter_count_signature(word):
+    # Same key as sorted_signature, built by counting sort over a-z in linear time
+    # (words with any other character fall back to sorted_signature).
+    # Asymptotic alternative only: for English-length words the Python loop is several times slower
+    # than the C sort behind sorted_signature
+    # Time = O(k) Space = O(k)
+    if not (word.isascii() and word.isalpha() and word.islower()):
+        return sorted_signature(word)
+    counts = [0] * 26
+    for character in word:
+        counts[ord(character) - 97] += 1
+    return ''.join(chr(97 + letter) * count for letter, count in enumerate(counts) if count)
+
+
+# One prime per letter a-z: anagrams (and only anagrams) have the same product
+_LETTER_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101)
+
+
+def prime_product_signature(word):
+    # Product of one prime per letter, written as '#<digits>' so it never equals a sorted root
+    # (words with any other character fall back to sorted_signature).
+    # Like letter_count_signature, slower than sorted_signature in CPython despite the better bound
+    # Time = O(k) multiplications Space = O(k)
+    if not (word.isascii() and word.isalpha() and word.islower()):
+        return sorted_signature(word)
+    product = 1
+    for character in word:
+        product *= _LETTER_PRIMES[ord(character) - 97]
+    return f"#{product}"
+
+
+# Signature functions that can be selected by name
+SIGNATURE_FUNCTIONS = {
+    'sorted': sorted_signature,
+    'letter_count': letter_count_signature,
+    'prime_product': prime_product_signature,
+}
+
+
+class AnagramRootCache:
+    # Bounded memo from word to anagram root, so repeated words skip the signature function.
+    # The least recently used words are evicted once max_size words are cached (None = unbounded)
+    # Time = O(1) Space = O(max_size)
+    def __init__(self, signature='sorted', max_size=65536):
+        if isinstance(signature, str):
+            if signature not in SIGNATURE_FUNCTIONS:
+                raise ValueError(f"Unknown signature function: {signature}")
+            signature = SIGNATURE_FUNCTIONS[signature]
+        self.signature = signature
+        self.max_size = max_size
+        self.root = lru_cache(maxsize=max_size)(signature) # root(word) -> anagram root
+
+    def stats(self):
+        # Hits, misses, cached words and hit rate since the cache was created
+        # Time = O(1) Space = O(1)
+        info = self.root.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'max_size': self.max_size,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
+
+
+def parse_and_insert_anagram_roots(file_path, hash_table, root_cache=None):
+    # root_cache: AnagramRootCache choosing the signature function (a fresh sorted-signature cache by default)
+    if root_cache is None:
+        root_cache = AnagramRootCache()
+    anagram_root = root_cache.root
     try:
-        with open(file_path, 'r') as file:
-            for line in file:
-                # Replace non-alphanumeric characters with spaces , convert all letters to lowercase, and joins characters into single string
-                processed_line = ''.join(char if char.isalnum() else ' ' for char in line.lower())
-                # Split the processed string into a list of words
-                cleaned_words = processed_line.split()
-
-                for word in cleaned_words:
-                    if word:  # Ignore empty strings
-                        # Step 1: Sort the word to get its anagram root (key)
-                        sorted_word = ''.join(sorted(word)) # join sorted words to single string
-                        # Step 2: Insert the sorted word (anagram root) into the hash table if it does not exist
-                        if not hash_table.retrieve(sorted_word):
-                            hash_table.insert(sorted_word, True)  # True is a placeholder that tracks the sorted words in the hashtable
+        for word in iter_words(file_path):
+            # Step 1: Get the word's anagram root (key), skipping the signature for cached words
+            sorted_word = anagram_root(word)
+            # Step 2: Insert the sorted word (anagram root) into the hash table if it does not exist
+            # (one hash and one chain walk per word)
+            hash_table.setdefault(sorted_word, True)  # True is a placeholder that tracks the sorted words in the hashtable
 
     except FileNotFoundError:
         print(f"Error: The file at {file_path} was not found.")
         return 0
 
 
-# File path to 'pride-and-prejudice.txt'
-file_path = 'pride-and-prejudice.txt'
+class AnagramIndex:
+    # Index from anagram root to the distinct words that share it and their frequencies,
+    # so "all anagrams of X" is answered without scanning the text again.
+    # Roots are stored in a HashTable whose values are {word: frequency} dicts.
+    # Text can be added at any time, and add_file only reads what was appended since the last call
+    # Time = O(1) Space = O(size)
+    def __init__(self, size=10000, root_cache=None, hash_function='fnv1a'):
+        self.roots = HashTable(size, hash_function=hash_function)
+        self.root_cache = root_cache if root_cache is not None else AnagramRootCache()
+        self.word_count = 0 # Words indexed, repeats included
+        self.file_offsets = {} # Bytes of each file already indexed
+
+    def add_word(self, word):
+        # Count one occurrence of a lower case alphanumeric word
+        # Time = O(k + g) (g = words in its anagram group) amortized Space = O(1) amortized
+        words = self.roots.get_or_insert(self.root_cache.root(word), dict)
+        if words is not None:
+            words[word] = words.get(word, 0) + 1
+            self.word_count += 1
+
+    def add_words(self, words):
+        # Time = O(total length of the words) Space = O(distinct words)
+        for word in words:
+            self.add_word(word)
+
+    def add_text(self, text):
+        # Index every word of a string, split the same way as the anagram file parser
+        # Time = O(len(text)) Space = O(distinct words)
+        self.add_words(_WORD_PATTERN.findall(text.lower()))
+
+    def add_file(self, file_path, include_partial_line=False):
+        # Index the text added to the file since the previous call (the whole file the first time).
+        # Only complete lines are read, so a word still being written is not split;
+        # include_partial_line=True also reads a last line without a newline (e.g. at end of input)
+        # Returns the number of bytes read
+        # Time = O(new bytes) Space = O(chunk size + distinct words)
+        start = self.file_offsets.get(file_path, 0)
+        with open(file_path, 'rb') as file:
+            end = os.fstat(file.fileno()).st_size
+            if end > start and not include_partial_line:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    end = data.rfind(b'\n', start, end) + 1 # 0 when there is no complete line
+        if end <= start:
+            return 0
+        self.add_words(iter_words(file_path, start, end))
+        self.file_offsets[file_path] = end
+        return end - start
+
+    def anagrams_of(self, word):
+        # Read-only {word: frequency} view of every indexed word with the same letters as word
+        # (empty when there are none). The word itself is only included if it occurs in the text
+        # Time = O(k) Space = O(1)
+        words = self.roots.retrieve(self.root_cache.root(word.lower()))
+        return MappingProxyType(words if words is not None else {})
+
+    def frequency(self, word):
+        # Time = O(k) Space = O(1)
+        return self.anagrams_of(word).get(word.lower(), 0)
+
+    def root_count(self):
+        # Number of distinct anagram roots
+        # Time = O(1) Space = O(1)
+        return self.roots.curr_size()
+
+
+def line_aligned_ranges(file_path, parts):
+    # Split a file into at most parts byte ranges (start, end) that begin at the start of a line
+    # Time = O(parts + longest line) Space = O(parts)
+    file_size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, 'rb') as file:
+        for i in range(1, parts):
+            position = file_size * i // parts
+            if position <= boundaries[-1]:
+                continue
+            # Move the boundary forward to the start of the next line
+            file.seek(position - 1)
+            file.readline()
+            position = file.tell()
+            if boundaries[-1] < position < file_size:
+                boundaries.append(position)
+    boundaries.append(file_size)
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)]
+
+
+def anagram_roots_in_range(file_path, start, end, encoding, hash_function='fnv1a',
+                           signature=sorted_signature, cache_size=65536):
+    # Worker: anagram roots of the words in one byte range, collected in a local hash table.
+    # Returns the distinct roots as a list (cheaper to send back than the table's nodes)
+    # Time = O(range length + sum of k log k) Space = O(distinct roots)
+    local_table = HashTable(size=1024, hash_function=hash_function)
+    anagram_root = AnagramRootCache(signature, cache_size).root
+    for word in iter_words(file_path, start, end, encoding=encoding):
+        local_table.setdefault(anagram_root(word), True)
+    return [key for key, _ in local_table.items()]
+
+
+def parallel_parse_and_insert_anagram_roots(file_path, hash_table, workers=None, chunks_per_worker=4,
+                                            root_cache=None):
+    # Same result as parse_and_insert_anagram_roots, computed by worker processes.
+    # The file is split into line-aligned byte ranges, each range is tokenized into a local table
+    # by a worker, and the partial results are merged into hash_table.
+    # Each worker builds its own cache with root_cache's signature function and size
+    # (root_cache itself is not updated)
+    # Time = O((file size + sum of k log k) / workers + distinct roots) Space = O(distinct roots)
+    # Imported here since process pools are costly to import and only this function needs them
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not os.path.exists(file_path):
+        print(f"Error: The file at {file_path} was not found.")
+        return 0
+    workers = workers or os.cpu_count() or 1
+    # Decode the same way open(file_path, 'r') does in the serial version
+    encoding = locale.getpreferredencoding(False)
+    ranges = line_aligned_ranges(file_path, workers * chunks_per_worker)
+    hash_function = getattr(hash_table, 'hash_function', 'fnv1a')
+    if root_cache is None:
+        root_cache = AnagramRootCache()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(anagram_roots_in_range, file_path, start, end, encoding, hash_function,
+                                   root_cache.signature, root_cache.max_size)
+                   for start, end in ranges]
+        # Merge in file order so the result does not depend on which worker finishes first
+        for future in futures:
+            hash_table.insert_many((root, True) for root in future.result())
+
+
+# Demo, run with: python Hashtable.py (or python -m Hashtable)
+def main():
+    # Task 1 Test Case
+    print('-------task 1--------')
+    hash_table = HashTable(10, hash_function='letter_sum') # Original hash, keeps the collision at index 4
+
+    # Initialize an empty HashTable
+    print(f'Initialize an empty HashTable: {hash_table.curr_size()}')  # Output: 0
+
+    # Insert alpha keys into the HashTable
+    hash_table.insert("Ben", "99")
+    hash_table.insert("Kobbie", "7")
+    hash_table.insert("Timothy", "32")
+    hash_table.insert("Robert", "22")
+    hash_table.insert("Bander", "11")
+    hash_table.insert("Trent", "87")
+
+    hash_table.print_hashtable()
+
+    print(f'HashTable size after adding alphanumeric keys: {hash_table.curr_size()}')  # Output: 6
+
+    # Display that collisions are handled properly
+    print("\nContent at Index 4:")
+    hash_table.print_index(4)
+
+    # Insert non-alpha key (ignored by hash function)
+    hash_table.insert("@#?!", "Non-alphanumeric key value")
+    print(f'\nHashTable size after attempting to add Non-alphanumeric key: {hash_table.curr_size()}')  # Output: 6
+
+    # Prevent duplicate entries
+    hash_table.insert("Ben", "99")
+    print(f'HashTable size after attempting to add a duplicate: {hash_table.curr_size()}')  # Output: 6
+
+    # Retrieve values that are both present and not present in the list
+    print(f'\nRetrieve Ben: {hash_table.retrieve("Ben")}') # Value: 99
+    # Testing to retrieve a key that doesn't exist in the list
+    print(f'Retrieve non-existent key: {hash_table.retrieve("nonexistent")}')  # Output: None
+
+
+    # File path to 'pride-and-prejudice.txt' (next to this script)
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pride-and-prejudice.txt')
+
+
+    hash_table = HashTable(size=10000)
+
+    # Parse the file and insert unique anagram roots
+    parse_and_insert_anagram_roots(file_path, hash_table)
 
+    # Count of unique anagram roots
+    unique_anagram_roots_count = hash_table.curr_size()
 
-hash_table = HashTable(size=10000)
+    # Step 3: Results of the count of anagram root words
+    print('\n-------Task 2--------\n')
+    print(f"Number of unique anagram-root words: {unique_anagram_roots_count}")
 
-# Parse the file and insert unique anagram roots
-parse_and_insert_anagram_roots(file_path, hash_table)
+    # Anagram groups: which words formed each root, and how often they occur
+    anagram_index = AnagramIndex()
+    anagram_index.add_file(file_path)
+    print('\n-------Anagram index--------\n')
+    for word in ("listen", "stop", "night"):
+        print(f"Anagrams of {word}: {dict(anagram_index.anagrams_of(word))}")
 
-# Count of unique anagram roots
-unique_anagram_roots_count = hash_table.curr_size()
 
-# Step 3: Results of the count of anagram root words
-print('\n-------Task 2--------\n')
-print(f"Number of unique anagram-root words: {unique_anagram_roots_count}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# Hash table package
+# Importing the package does no work: each submodule is imported the first time
+# one of its names is used (e.g. Hashtable.HashTable), and the demos only run through main() / python -m Hashtable
+import importlib
+
+# Submodule -> public names it provides
+_SUBMODULES = {
+    'Hashtable': (
+        'HashTable', 'FlatHashTable', 'ConcurrentHashTable', 'HashTableSnapshot', 'BloomFilter',
+        'LinkedList', 'Node', 'HASH_FUNCTIONS', 'letter_sum_hash', 'fnv1a_hash', 'python_hash',
+        'blake2b_hash', 'resolve_hash_function', 'SIGNATURE_FUNCTIONS', 'sorted_signature',
+        'letter_count_signature', 'prime_product_signature', 'AnagramRootCache', 'AnagramIndex',
+        'iter_words', 'parse_and_insert_anagram_roots', 'line_aligned_ranges',
+        'parallel_parse_and_insert_anagram_roots', 'main',
+    ),
+    'Cache': (
+        'LRUCache', 'CacheNode',
+    ),
+}
+_LAZY_NAMES = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = sorted(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    # Time = O(1) after the first use of a submodule's names
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
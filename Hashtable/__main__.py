@@ -0,0 +1,4 @@
+# Run the demo: python -m Hashtable
+from .Hashtable import main
+
+main()
@@ -0,0 +1,331 @@
+# Benchmarks for the hash table implementations
+# Run from this folder: python benchmarks.py
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from Hashtable import (HashTable, FlatHashTable, ConcurrentHashTable, HASH_FUNCTIONS, SIGNATURE_FUNCTIONS, AnagramRootCache, iter_words,
+                       parse_and_insert_anagram_roots, parallel_parse_and_insert_anagram_roots)
+
+# Default corpus shipped next to this script
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pride-and-prejudice.txt')
+
+
+def corpus_words(file_path=CORPUS_PATH):
+    # Every word of the corpus (lower case, split on non-alphanumeric characters), in order
+    # Time = O(n) Space = O(n) (n = characters in the file)
+    return list(iter_words(file_path))
+
+
+def line_by_line_words(file_path):
+    # The original tokenizer: rebuild every line one character at a time, then split it
+    with open(file_path, 'r') as file:
+        for line in file:
+            yield from ''.join(char if char.isalnum() else ' ' for char in line.lower()).split()
+
+
+def benchmark_hash_functions(keys, size=10000):
+    # Insert the distinct keys into a fixed-size table with every hash function
+    # and report bucket occupancy, chain lengths and insert time
+    keys = list(dict.fromkeys(keys))
+    print(f"{len(keys)} distinct keys into {size} buckets")
+    print(f"{'hash':<12}{'occupied':>10}{'occupancy':>11}{'max chain':>11}{'avg chain':>11}{'insert (s)':>12}")
+    for name in HASH_FUNCTIONS:
+        hash_table = HashTable(size, max_load_factor=None, hash_function=name)
+        start = time.perf_counter()
+        for key in keys:
+            hash_table.insert(key, True)
+        elapsed = time.perf_counter() - start
+
+        stats = hash_table.stats()
+        occupied = stats['occupied_buckets']
+        print(f"{name:<12}{occupied:>10}{occupied / size:>10.1%}{stats['max_chain']:>11}"
+              f"{stats['average_chain']:>11.2f}{elapsed:>12.3f}")
+
+
+def benchmark_chained_vs_flat(keys, rounds=5):
+    # Memory used per entry and lookup throughput (hits and misses) of HashTable and FlatHashTable.
+    # Keys are created before measuring, so only the table's own allocations are counted
+    keys = list(dict.fromkeys(keys))
+    missing = [key + '0' for key in keys]
+    print(f"{len(keys)} distinct keys, {rounds} lookup rounds")
+    print(f"{'table':<16}{'bytes/entry':>12}{'hits/s':>14}{'misses/s':>14}")
+    for name, table_class in (('HashTable', HashTable), ('FlatHashTable', FlatHashTable)):
+        tracemalloc.start()
+        hash_table = table_class(16)
+        for key in keys:
+            hash_table.insert(key, True)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        rates = []
+        for lookups in (keys, missing):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for key in lookups:
+                    hash_table.retrieve(key)
+            rates.append(rounds * len(lookups) / (time.perf_counter() - start))
+        print(f"{name:<16}{memory / len(keys):>12.1f}{rates[0]:>14,.0f}{rates[1]:>14,.0f}")
+
+    # Both tables work as the anagram-root store
+    for table_class in (HashTable, FlatHashTable):
+        hash_table = table_class(10000)
+        parse_and_insert_anagram_roots(CORPUS_PATH, hash_table)
+        print(f"{table_class.__name__} unique anagram roots: {hash_table.curr_size()}")
+
+
+def benchmark_batch_operations(keys, size=1024):
+    # Loop of single insert/retrieve calls against one insert_many/retrieve_many call
+    keys = list(keys)
+    pairs = [(key, True) for key in keys]
+    print(f"{len(keys)} keys ({len(set(keys))} distinct)")
+    print(f"{'operation':<12}{'single (s)':>12}{'batch (s)':>12}{'speed-up':>10}")
+
+    single_table = HashTable(size)
+    start = time.perf_counter()
+    for key, value in pairs:
+        single_table.insert(key, value)
+    single = time.perf_counter() - start
+
+    batch_table = HashTable(size)
+    start = time.perf_counter()
+    batch_table.insert_many(pairs)
+    batch = time.perf_counter() - start
+    print(f"{'insert':<12}{single:>12.3f}{batch:>12.3f}{single / batch:>9.1f}x")
+
+    start = time.perf_counter()
+    single_results = [single_table.retrieve(key) for key in keys]
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_results = batch_table.retrieve_many(keys)
+    batch = time.perf_counter() - start
+    print(f"{'retrieve':<12}{single:>12.3f}{batch:>12.3f}{single / batch:>9.1f}x")
+    assert single_results == batch_results
+
+
+def repeated_corpus(copies, file_path=CORPUS_PATH):
+    # Temporary file holding the corpus repeated copies times (the caller deletes it)
+    with open(file_path, 'rb') as file:
+        text = file.read()
+    handle, path = tempfile.mkstemp(suffix='.txt')
+    with os.fdopen(handle, 'wb') as output:
+        for _ in range(copies):
+            output.write(text)
+    return path
+
+
+def benchmark_parallel_anagram_roots(copies=8, worker_counts=(1, 2, 4, 8)):
+    # Serial anagram-root counting against the parallel version on a larger corpus
+    path = repeated_corpus(copies)
+    try:
+        megabytes = os.path.getsize(path) / 1e6
+        print(f"{megabytes:.1f} MB corpus, {os.cpu_count()} CPUs")
+        print(f"{'mode':<14}{'roots':>8}{'time (s)':>10}{'MB/s':>8}")
+
+        hash_table = HashTable(10000)
+        start = time.perf_counter()
+        parse_and_insert_anagram_roots(path, hash_table)
+        elapsed = time.perf_counter() - start
+        serial_count = hash_table.curr_size()
+        print(f"{'serial':<14}{serial_count:>8}{elapsed:>10.2f}{megabytes / elapsed:>8.1f}")
+
+        for workers in worker_counts:
+            hash_table = HashTable(10000)
+            start = time.perf_counter()
+            parallel_parse_and_insert_anagram_roots(path, hash_table, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"{f'{workers} workers':<14}{hash_table.curr_size():>8}{elapsed:>10.2f}{megabytes / elapsed:>8.1f}")
+            assert hash_table.curr_size() == serial_count
+    finally:
+        os.remove(path)
+
+
+def benchmark_tokenizers(copies=8):
+    # Words per second of the line-by-line tokenizer against iter_words (memory-mapped and buffered)
+    path = repeated_corpus(copies)
+    try:
+        print(f"{os.path.getsize(path) / 1e6:.1f} MB corpus")
+        print(f"{'tokenizer':<16}{'words':>10}{'time (s)':>10}{'words/s':>14}")
+        tokenizers = (
+            ('line by line', lambda: line_by_line_words(path)),
+            ('iter_words mmap', lambda: iter_words(path)),
+            ('iter_words read', lambda: iter_words(path, use_mmap=False)),
+        )
+        for name, tokenizer in tokenizers:
+            start = time.perf_counter()
+            count = sum(1 for _ in tokenizer())
+            elapsed = time.perf_counter() - start
+            print(f"{name:<16}{count:>10}{elapsed:>10.3f}{count / elapsed:>14,.0f}")
+    finally:
+        os.remove(path)
+
+
+def benchmark_signatures(words, cache_sizes=(0, 1024, 65536)):
+    # Time to compute the anagram root of every word for each signature function and cache size
+    # (0 disables caching), with the cache hit rate and the number of distinct roots
+    print(f"{len(words)} words")
+    print(f"{'signature':<15}{'cache':>8}{'time (s)':>10}{'hit rate':>10}{'roots':>8}")
+    for name, signature in SIGNATURE_FUNCTIONS.items():
+        for cache_size in cache_sizes:
+            root_cache = AnagramRootCache(signature, cache_size) if cache_size else None
+            anagram_root = root_cache.root if root_cache else signature
+            start = time.perf_counter()
+            roots = [anagram_root(word) for word in words]
+            elapsed = time.perf_counter() - start
+            hit_rate = root_cache.stats()['hit_rate'] if root_cache else 0.0
+            print(f"{name:<15}{cache_size:>8}{elapsed:>10.3f}{hit_rate:>10.1%}{len(set(roots)):>8}")
+
+
+def benchmark_snapshot(copies=8):
+    # Cold start: rebuilding the anagram-root table from the text against loading a saved snapshot
+    path = repeated_corpus(copies)
+    handle, snapshot_path = tempfile.mkstemp(suffix='.snap')
+    os.close(handle)
+    try:
+        start = time.perf_counter()
+        hash_table = HashTable(10000)
+        parse_and_insert_anagram_roots(path, hash_table)
+        rebuild = time.perf_counter() - start
+        first_key = next(iter(hash_table.items()))[0]
+
+        start = time.perf_counter()
+        hash_table.save(snapshot_path)
+        save = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with HashTable.load(snapshot_path) as snapshot:
+            value = snapshot.retrieve(first_key)
+            load = time.perf_counter() - start
+        assert value is True
+
+        print(f"{os.path.getsize(path) / 1e6:.1f} MB corpus, {hash_table.curr_size()} roots, "
+              f"{os.path.getsize(snapshot_path) / 1e3:.0f} kB snapshot")
+        print(f"rebuild from text:        {rebuild * 1000:>10.1f} ms")
+        print(f"save snapshot:            {save * 1000:>10.1f} ms")
+        print(f"load + first lookup:      {load * 1000:>10.3f} ms")
+    finally:
+        os.remove(path)
+        os.remove(snapshot_path)
+
+
+def benchmark_concurrent_table(key_count=20000, operations=20000, thread_counts=(1, 4, 16),
+                               stripe_counts=(1, 16, 64), read_ratio=0.8):
+    # Mixed insert/retrieve workload from several threads; stripes=1 is the single global lock case.
+    # Also checks that no insert was lost
+    print(f"{operations} operations per thread, {read_ratio:.0%} retrieves, {key_count} possible keys")
+    print(f"{'threads':>8}{'stripes':>9}{'ops/s':>14}{'keys':>8}")
+    keys = [f"key{i}" for i in range(key_count)]
+    for threads in thread_counts:
+        for stripes in stripe_counts:
+            hash_table = ConcurrentHashTable(1024, stripes=stripes)
+            inserted = [set() for _ in range(threads)]
+            barrier = threading.Barrier(threads + 1)
+
+            def worker(thread_id):
+                rng = random.Random(thread_id)
+                plan = [(rng.random() < read_ratio, rng.choice(keys)) for _ in range(operations)]
+                barrier.wait()
+                for is_read, key in plan:
+                    if is_read:
+                        hash_table.retrieve(key)
+                    else:
+                        hash_table.insert(key, thread_id)
+                        inserted[thread_id].add(key)
+
+            workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+            for thread in workers:
+                thread.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for thread in workers:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+            expected = len(set().union(*inserted))
+            assert hash_table.curr_size() == expected == len(hash_table.items())
+            print(f"{threads:>8}{stripes:>9}{threads * operations / elapsed:>14,.0f}{expected:>8}")
+
+
+def benchmark_bloom_filter(keys, miss_ratio=0.9, lookups=100000, false_positive_rate=0.01):
+    # Lookup throughput of a miss-heavy workload with and without a Bloom filter in front of the table,
+    # with the filter's measured false-positive rate and memory. 'resizing' tables grow to keep the
+    # load under 0.75, 'fixed/8' and 'fixed/128' tables have one bucket per 8 or 128 keys (long chains).
+    # The filter is either consulted on every lookup ('always', min_chain=0) or only for chains of at
+    # least 32 nodes ('gated', the default)
+    # Half of the distinct keys go into the table, the other half are the misses
+    distinct = list(dict.fromkeys(keys))
+    keys, absent = distinct[::2], distinct[1::2]
+    rng = random.Random(0)
+    workload = [rng.choice(absent if rng.random() < miss_ratio else keys) for _ in range(lookups)]
+    print(f"{len(keys)} keys, {lookups} lookups, {miss_ratio:.0%} misses")
+    print(f"{'hash':<12}{'table':<10}{'bloom':>7}{'lookups/s':>14}{'measured FP':>13}{'memory (B)':>12}")
+    for name in ('letter_sum', 'fnv1a'):
+        for table_kind, keys_per_bucket in (('resizing', None), ('fixed/8', 8), ('fixed/128', 128)):
+            for mode, min_chain in (('no', None), ('always', 0), ('gated', 32)):
+                if keys_per_bucket is None:
+                    hash_table = HashTable(len(keys), hash_function=name)
+                else:
+                    hash_table = HashTable(max(1, len(keys) // keys_per_bucket), max_load_factor=None,
+                                           hash_function=name)
+                hash_table.insert_many((key, True) for key in keys)
+                bloom = None
+                if min_chain is not None:
+                    bloom = hash_table.attach_bloom_filter(len(keys), false_positive_rate, min_chain=min_chain)
+                elapsed = float('inf')
+                for _ in range(3): # Best of 3 passes, the timings are noisy
+                    start = time.perf_counter()
+                    for key in workload:
+                        hash_table.retrieve(key)
+                    elapsed = min(elapsed, time.perf_counter() - start)
+                if bloom is not None and bloom.rejections + bloom.false_positives:
+                    stats = bloom.stats()
+                    extra = f"{stats['measured_false_positive_rate']:>13.4f}{stats['memory_bytes']:>12}"
+                elif bloom is not None: # No chain was long enough to consult the filter
+                    extra = f"{'-':>13}{bloom.memory_bytes():>12}"
+                else:
+                    extra = f"{'-':>13}{'-':>12}"
+                print(f"{name:<12}{table_kind:<10}{mode:>7}{lookups / elapsed:>14,.0f}{extra}")
+
+
+if __name__ == "__main__":
+    words = corpus_words()
+
+    print('-------Hash functions: distinct words--------')
+    benchmark_hash_functions(words)
+
+    print('\n-------Hash functions: anagram roots--------')
+    benchmark_hash_functions(''.join(sorted(word)) for word in words)
+
+    print('\n-------Hash functions: synthetic keys--------')
+    benchmark_hash_functions((f"{word}{i}" for i, word in enumerate(words[:30000])), size=50000)
+
+    print('\n-------Chained vs flat table--------')
+    benchmark_chained_vs_flat(f"{word}{i}" for i, word in enumerate(words[:50000]))
+
+    print('\n-------Batch operations: corpus words--------')
+    benchmark_batch_operations(words)
+
+    print('\n-------Batch operations: distinct keys--------')
+    benchmark_batch_operations(f"{word}{i}" for i, word in enumerate(words))
+
+    print('\n-------Anagram signatures--------')
+    benchmark_signatures(words)
+
+    print('\n-------Bloom filter--------')
+    benchmark_bloom_filter(words)
+
+    print('\n-------Concurrent table--------')
+    benchmark_concurrent_table()
+
+    print('\n-------Parallel anagram roots--------')
+    benchmark_parallel_anagram_roots()
+
+    print('\n-------Tokenizers--------')
+    benchmark_tokenizers()
+
+    print('\n-------Snapshot cold start--------')
+    benchmark_snapshot()
@@ -0,0 +1,199 @@
+# asyncio priority queue built on PriorityQueue, for cooperative schedulers
+# Waiting producers and consumers park on futures (the way asyncio.Queue does), so no locks or events are needed
+import asyncio
+from collections import deque
+
+from Heap import PriorityQueue
+
+
+class AsyncPriorityQueue:
+    # Items come out smallest priority first; equal priorities come out in put order.
+    # maxsize: most items held at once (ready and scheduled), put waits while the queue is full. 0 = unbounded
+    # key: priority of an item when put gets none, None uses the item itself
+    # Scheduled items (put with not_before, in loop.time() seconds) stay invisible to get until that time
+    def __init__(self, maxsize=0, key=None):
+        self.maxsize = maxsize
+        self.key = key
+        self._ready = PriorityQueue() # (priority, sequence, item)
+        self._scheduled = PriorityQueue() # (not_before, sequence, priority, item)
+        self._sequence = 0 # Tie-breaker, so items themselves are never compared
+        self._size = 0 # Items held, ready or scheduled
+        self._scheduled_size = 0 # Plain counters keep the hot paths free of method calls
+        self._getters = deque() # Futures of consumers waiting for an item
+        self._putters = deque() # Futures of producers waiting for room
+        self._loop = None
+        self._timer = None # Loop callback that releases the next scheduled item
+        self._timer_when = None
+
+    def __repr__(self):
+        return (f"AsyncPriorityQueue(maxsize={self.maxsize}, ready={self._size - self._scheduled_size}, "
+                f"scheduled={self._scheduled_size})")
+
+    def _get_loop(self):
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    # Number of items held, ready or scheduled
+    # Time = O(1) Space = O(1)
+    def qsize(self):
+        return self._size
+
+    # True if get_nowait would fail right now (nothing is ready)
+    # Time = O(s log n) for s newly due scheduled items Space = O(1)
+    def empty(self):
+        if self._scheduled_size:
+            self._release_due()
+        return self._size == self._scheduled_size
+
+    def full(self):
+        return 0 < self.maxsize <= self._size
+
+    # Resolve the first waiter that is still waiting
+    # Time = O(1) amortized Space = O(1)
+    def _wakeup_next(self, waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    # Move every scheduled item whose time has come into the ready heap and wake one consumer for each
+    # Time = O(s log n) Space = O(1)
+    def _release_due(self):
+        scheduled = self._scheduled
+        now = self._get_loop().time()
+        while self._scheduled_size and scheduled.peek()[0] <= now:
+            _, sequence, priority, item = scheduled.pop()
+            self._scheduled_size -= 1
+            self._ready.push((priority, sequence, item))
+            self._wakeup_next(self._getters)
+
+    # Keep one loop timer armed for the earliest scheduled item
+    # Time = O(1) Space = O(1)
+    def _arm_timer(self):
+        if not self._scheduled_size:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = self._timer_when = None
+            return
+        when = self._scheduled.peek()[0]
+        if self._timer is not None:
+            if self._timer_when <= when:
+                return # Already fires early enough
+            self._timer.cancel()
+        self._timer = self._get_loop().call_at(when, self._on_timer)
+        self._timer_when = when
+
+    def _on_timer(self):
+        self._timer = self._timer_when = None
+        self._release_due()
+        self._arm_timer()
+
+    # Add an item without waiting. Raises asyncio.QueueFull if the queue is full
+    # Time = O(log n) Space = O(1)
+    def put_nowait(self, item, priority=None, not_before=None):
+        if 0 < self.maxsize <= self._size:
+            raise asyncio.QueueFull
+        if priority is None:
+            priority = self.key(item) if self.key is not None else item
+        self._sequence += 1
+        self._size += 1
+        if not_before is not None and not_before > self._get_loop().time():
+            self._scheduled.push((not_before, self._sequence, priority, item))
+            self._scheduled_size += 1
+            self._arm_timer()
+        else:
+            self._ready.push((priority, self._sequence, item))
+            if self._getters:
+                self._wakeup_next(self._getters)
+
+    # Add an item, waiting while the queue is full (backpressure)
+    # Time = O(log n) Space = O(1)
+    async def put(self, item, priority=None, not_before=None):
+        while self.full():
+            putter = self._get_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except:
+                putter.cancel() # Just in case the putter is not done yet
+                try:
+                    self._putters.remove(putter)
+                except ValueError:
+                    pass # Already removed by _wakeup_next
+                if not self.full() and not putter.cancelled():
+                    self._wakeup_next(self._putters) # Pass the wake-up this task received on
+                raise
+        self.put_nowait(item, priority, not_before)
+
+    # Remove and return the ready item with the smallest priority. Raises asyncio.QueueEmpty if none is ready
+    # Time = O(log n) Space = O(1)
+    def get_nowait(self):
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._ready.pop()[2]
+        self._size -= 1
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return item
+
+    # Remove and return the ready item with the smallest priority, waiting until one is ready
+    # Time = O(log n) Space = O(1)
+    async def get(self):
+        while self.empty():
+            getter = self._get_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if not self.empty() and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    # Wait for at least one ready item, then return up to n ready items in priority order without waiting again
+    # Time = O(k log n) for k items returned Space = O(k)
+    async def get_many(self, n):
+        if n <= 0:
+            return []
+        items = [await self.get()]
+        while len(items) < n and not self.empty():
+            items.append(self.get_nowait())
+        return items
+
+
+# Demo, run with: python AsyncQueue.py (or python -m Heap.AsyncQueue)
+def main():
+    async def demo():
+        queue = AsyncPriorityQueue(maxsize=4)
+        now = asyncio.get_running_loop().time()
+        await queue.put("nightly report", priority=1, not_before=now + 0.05) # Not visible for 50 ms
+        await queue.put("backup", priority=3)
+        await queue.put("email", priority=1)
+        await queue.put("deploy", priority=2)
+        print("Full:", queue.full())
+        print("Ready now:", await queue.get_many(10))
+        print("After the delay:", await queue.get())
+
+        # Producers block once 4 items are waiting; each get takes the most urgent item waiting at that moment
+        async def producer(name, priorities):
+            for priority in priorities:
+                await queue.put(f"{name}-{priority}", priority=priority)
+
+        async def consumer(count):
+            return [await queue.get() for _ in range(count)]
+
+        results = await asyncio.gather(producer("a", [5, 1, 3]), producer("b", [4, 2, 6]), consumer(6))
+        print("Consumed:", results[2])
+
+    asyncio.run(demo())
+
+
+if __name__ == "__main__":
+    main()
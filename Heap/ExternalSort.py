@@ -0,0 +1,179 @@
+# External merge sort for line-based record files that do not fit in memory
+# Records are read in chunks that fit the memory budget, each chunk is sorted and written to a temporary
+# run file, and the runs are streamed back through a heap-driven k-way merge
+import os
+import sys
+import tempfile
+
+from Heap import PriorityQueue
+
+
+# Merge already sorted iterables into one sorted stream, holding one item per iterable.
+# Heap entries are [key, source index, item, iterator]: the index breaks ties, so equal keys come out
+# in source order (a stable merge) and items are never compared
+# Time = O(n log k) Space = O(k) (k = number of iterables)
+def merge(*iterables, key=None):
+    queue = PriorityQueue()
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator: # Only the first item
+            queue.push([item if key is None else key(item), index, item, iterator])
+            break
+
+    while len(queue) > 1:
+        entry = queue.peek()
+        yield entry[2]
+        for item in entry[3]: # Advance the source that just produced, then sift it back into place
+            entry[0] = item if key is None else key(item)
+            entry[2] = item
+            queue.replace(entry)
+            break
+        else:
+            queue.pop() # Source exhausted
+
+    if queue: # One source left: stream the rest of it without the heap
+        entry = queue.pop()
+        yield entry[2]
+        yield from entry[3]
+
+
+class ExternalSorter:
+    # key: function of a record (one line, newline included) giving its sort key, None sorts the lines themselves
+    # memory_limit: approximate bytes of records held at once while building runs, and shared by the
+    # read buffers while merging
+    # fan_in: most runs merged in one pass. More runs are first merged in groups into longer runs
+    # temp_dir: where run files go (None = the system default). They are deleted once the sort finishes
+    def __init__(self, key=None, memory_limit=64 * 2 ** 20, fan_in=64, temp_dir=None, encoding='utf-8'):
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self.key = key
+        self.memory_limit = memory_limit
+        self.fan_in = fan_in
+        self.temp_dir = temp_dir
+        self.encoding = encoding
+        self.runs_written = 0 # Statistics of the last sort
+        self.merge_passes = 0
+
+    # Approximate memory of one record while its run is sorted: the string and its list slot, plus the
+    # key list.sort builds for it. The key size is sampled from the first record of each run
+    # Time = O(1) Space = O(1)
+    def _record_size(self, line, key_size):
+        return sys.getsizeof(line) + 8 + key_size
+
+    def _key_size(self, line):
+        return sys.getsizeof(self.key(line)) + 8 if self.key is not None else 0
+
+    # Cut the input into sorted runs that each fit the memory budget and write them to run_dir
+    # Time = O(n log m) Space = O(m) (m = records per run)
+    def _write_runs(self, lines, run_dir):
+        paths = []
+        chunk = []
+        used = 0
+        key_size = None
+        for line in lines:
+            if not line.endswith('\n'):
+                line += '\n' # The last line of a file may have no newline
+            if key_size is None:
+                key_size = self._key_size(line)
+            chunk.append(line)
+            used += self._record_size(line, key_size)
+            if used >= self.memory_limit:
+                paths.append(self._write_run(chunk, run_dir, len(paths)))
+                chunk = []
+                used = 0
+                key_size = None
+        if chunk or not paths:
+            paths.append(self._write_run(chunk, run_dir, len(paths)))
+        self.runs_written = len(paths)
+        return paths
+
+    def _write_run(self, chunk, run_dir, number):
+        # list.sort is stable, so equal keys keep their input order inside a run
+        chunk.sort(key=self.key)
+        path = os.path.join(run_dir, f"run-{number:06d}.txt")
+        with open(path, 'w', encoding=self.encoding) as run_file:
+            run_file.writelines(chunk)
+        return path
+
+    # Read buffer per open run, so that fan_in buffers share the memory budget
+    def _buffer_size(self, runs):
+        return max(4096, self.memory_limit // (runs + 1))
+
+    # Merge groups of fan_in runs into longer runs until one pass can merge them all
+    # Time = O(n log k) per pass Space = O(fan_in)
+    def _reduce_runs(self, paths, run_dir):
+        passes = 0
+        while len(paths) > self.fan_in:
+            passes += 1
+            merged_paths = []
+            for start in range(0, len(paths), self.fan_in):
+                group = paths[start:start + self.fan_in]
+                path = os.path.join(run_dir, f"pass-{passes}-{start // self.fan_in:06d}.txt")
+                files = [open(run, 'r', encoding=self.encoding, buffering=self._buffer_size(len(group)))
+                         for run in group]
+                try:
+                    with open(path, 'w', encoding=self.encoding) as merged_file:
+                        merged_file.writelines(merge(*files, key=self.key))
+                finally:
+                    for file in files:
+                        file.close()
+                for run in group:
+                    os.remove(run)
+                merged_paths.append(path)
+            paths = merged_paths
+        self.merge_passes = passes + 1
+        return paths
+
+    # Sorted records of input_path, streamed one line at a time. Run files live until the generator
+    # is exhausted or closed
+    # Time = O(n log n) Space = O(memory_limit)
+    def sorted_lines(self, input_path):
+        with tempfile.TemporaryDirectory(prefix='external-sort-', dir=self.temp_dir) as run_dir:
+            with open(input_path, 'r', encoding=self.encoding) as input_file:
+                paths = self._write_runs(input_file, run_dir)
+            paths = self._reduce_runs(paths, run_dir)
+            files = [open(run, 'r', encoding=self.encoding, buffering=self._buffer_size(len(paths)))
+                     for run in paths]
+            try:
+                yield from merge(*files, key=self.key)
+            finally:
+                for file in files:
+                    file.close()
+
+    # Sort input_path into output_path and return the number of records written
+    # Time = O(n log n) Space = O(memory_limit)
+    def sort_file(self, input_path, output_path):
+        count = 0
+        with open(output_path, 'w', encoding=self.encoding) as output_file:
+            for line in self.sorted_lines(input_path):
+                output_file.write(line)
+                count += 1
+        return count
+
+
+# Sort a line-based record file into output_path with an ExternalSorter
+# Time = O(n log n) Space = O(memory_limit)
+def external_sort(input_path, output_path, key=None, memory_limit=64 * 2 ** 20, fan_in=64, temp_dir=None):
+    return ExternalSorter(key, memory_limit, fan_in, temp_dir).sort_file(input_path, output_path)
+
+
+# Demo, run with: python ExternalSort.py (or python -m Heap.ExternalSort)
+def main():
+    # Student records in the fixed-width format Tree.BST.read_data reads: name in columns 8-33
+    records_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Tree', 'tree-input.txt')
+
+    def student_name(line):
+        return line[8:33].strip()
+
+    # A tiny memory budget forces several runs and a multi-pass merge on this small file
+    sorter = ExternalSorter(key=student_name, memory_limit=512, fan_in=2)
+    names = [student_name(line) for line in sorter.sorted_lines(records_path)]
+    print("Student records sorted by name:")
+    print(names)
+    print(f"Runs written: {sorter.runs_written}, merge passes: {sorter.merge_passes}")
+
+    print("\nMerge of three sorted lists:", list(merge([1, 4, 7], [2, 5, 8], [3, 6, 9])))
+
+
+if __name__ == "__main__":
+    main()
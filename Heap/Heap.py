@@ -1,3 +1,5 @@
+from itertools import islice
+
 
 class Node:
     def __init__(self, data):
@@ -43,6 +45,136 @@ class BST:
             nums.append(node.data) # Append current node
             self.__in_order_recursive(node.right, nums) # Recur (right subtree)
 
+# Tree-style view over a heap kept in a flat list: children and parents are computed from indexes
+# (children of i are 2i+1 and 2i+2, parent is (i-1)//2), so walking the tree allocates no nodes
+class HeapView:
+    def __init__(self, array, size=None):
+        self.array = array # Shared, not copied: the view always shows the list's current contents
+        self.size = size # Number of heap elements at the front of array, None for the whole list
+
+    def __len__(self):
+        return len(self.array) if self.size is None else self.size
+
+    def __repr__(self):
+        return f"HeapView({list(self.bfs())!r})"
+
+    # Value at index i
+    # Time = O(1) Space = O(1)
+    def value(self, i):
+        if not 0 <= i < len(self):
+            raise IndexError("heap index out of range")
+        return self.array[i]
+
+    # Index of the root, left child, right child or parent, or None if there is none
+    # Time = O(1) Space = O(1)
+    def root(self):
+        return 0 if len(self) else None
+
+    def left(self, i):
+        child = 2 * i + 1
+        return child if child < len(self) else None
+
+    def right(self, i):
+        child = 2 * i + 2
+        return child if child < len(self) else None
+
+    def parent(self, i):
+        return (i - 1) >> 1 if i > 0 else None
+
+    # Indexes of the existing children of i
+    # Time = O(1) Space = O(1)
+    def children(self, i):
+        return range(min(2 * i + 1, len(self)), min(2 * i + 3, len(self)))
+
+    def is_leaf(self, i):
+        return 2 * i + 1 >= len(self)
+
+    # Level of index i (the root is at depth 0) and height of the whole tree (-1 when empty)
+    # Time = O(1) Space = O(1)
+    def depth(self, i):
+        return (i + 1).bit_length() - 1
+
+    def height(self):
+        return len(self).bit_length() - 1
+
+    # Values level by level, left to right: the array order itself
+    # Time = O(n) Space = O(1)
+    def bfs(self):
+        return islice(self.array, len(self))
+
+    # Index bounds (start, stop) of one level in the array
+    # Time = O(1) Space = O(1)
+    def level_bounds(self, depth):
+        start = (1 << depth) - 1
+        return start, min(2 * start + 1, len(self))
+
+    # Values in depth-first order ('pre', 'in' or 'post'), using an explicit stack of indexes
+    # Time = O(n) Space = O(log n)
+    def dfs(self, order='pre'):
+        n = len(self)
+        array = self.array
+        if order == 'pre':
+            stack = [0] if n else []
+            while stack:
+                i = stack.pop()
+                yield array[i]
+                if 2 * i + 2 < n:
+                    stack.append(2 * i + 2)
+                if 2 * i + 1 < n:
+                    stack.append(2 * i + 1)
+        elif order == 'in':
+            stack = []
+            i = 0
+            while stack or i < n:
+                while i < n: # Go as far left as possible
+                    stack.append(i)
+                    i = 2 * i + 1
+                i = stack.pop()
+                yield array[i]
+                i = 2 * i + 2
+        elif order == 'post':
+            stack = []
+            i = 0
+            last = -1
+            while stack or i < n:
+                while i < n:
+                    stack.append(i)
+                    i = 2 * i + 1
+                top = stack[-1]
+                right = 2 * top + 2
+                if right < n and right != last: # Right subtree not visited yet
+                    i = right
+                else:
+                    yield array[top]
+                    last = stack.pop()
+                    i = n
+        else:
+            raise ValueError(f"unknown order {order!r}, expected 'pre', 'in' or 'post'")
+
+    # Check the heap property on every parent/child pair
+    # Time = O(n) Space = O(1)
+    def is_min_heap(self):
+        array = self.array
+        return all(not array[i] < array[(i - 1) >> 1] for i in range(1, len(self)))
+
+    def is_max_heap(self):
+        array = self.array
+        return all(not array[(i - 1) >> 1] < array[i] for i in range(1, len(self)))
+
+    # Build a linked Node tree, only when a caller explicitly needs one. Nodes are created in
+    # array order and linked to their parent by index, so no queue is needed
+    # Time = O(n) Space = O(n)
+    def to_tree(self):
+        nodes = [Node(value) for value in self.bfs()]
+        for i in range(1, len(nodes)):
+            parent = nodes[(i - 1) >> 1]
+            if i & 1:
+                parent.left = nodes[i]
+            else:
+                parent.right = nodes[i]
+        return nodes[0] if nodes else None
+
+
 # Function to handle heap operations
 class HeapBuilder:
     # Helper function to ensure the smallest element is the root
@@ -95,65 +227,822 @@ class HeapBuilder:
         return arr
 
     # Convert to binary tree
+    # Time = O(n) Space = O(n)
     def heap_tree(self, nums):
         if not nums:
             return None
-        root = Node(nums[0])
-        queue = [root]
-        i = 1
-
-        while i < len(nums):
-            curr_node = queue.pop(0) # dequeue
-            if i < len(nums):
-                left_child = Node(nums[i])
-                curr_node.left = left_child # Assign current node as left child
-                queue.append(left_child) # Append the left child
-                i += 1
-
-            if i < len(nums):
-                right_child = Node(nums[i])
-                curr_node.right = right_child
-                queue.append(right_child)
-                i += 1
+        return HeapView(nums).to_tree()
 
-        return root
+    # Index-based view of a heap list, with no Node allocation
+    # Time = O(1) Space = O(1)
+    def heap_view(self, nums):
+        return HeapView(nums)
 
-    # Create min-heap tree from sorted list
+    # Create min-heap tree from sorted list. A non-decreasing list already is a min-heap,
+    # so it is used as is: no copy and no sifting
+    # Time = O(n) Space = O(n)
     def min_heap(self, nums):
         if not nums:
             return None
+        if self.is_sorted(nums):
+            return self.heap_tree(nums)
         heapified = self.build_min_heap(nums[:]) # Heapify the list
         return self.heap_tree(heapified) # Convert to tree
 
-    # Create max-heap tree from sorted list
+    # Create max-heap tree from sorted list. A non-increasing list already is a max-heap
+    # Time = O(n) Space = O(n)
     def max_heap(self, nums):
         if not nums:
             return None
+        if self.is_sorted(nums, reverse=True):
+            return self.heap_tree(nums)
         heapified = self.build_max_heap(nums[:])
         return self.heap_tree(heapified)
 
+    # True if nums is non-decreasing (non-increasing with reverse=True)
+    # Time = O(n) Space = O(1)
+    def is_sorted(self, nums, reverse=False):
+        if reverse:
+            return all(not nums[i - 1] < nums[i] for i in range(1, len(nums)))
+        return all(not nums[i] < nums[i - 1] for i in range(1, len(nums)))
+
+    # Views over a heapified copy of nums, for callers that only need to walk the heap
+    # Time = O(n) Space = O(n)
+    def min_heap_view(self, nums):
+        return HeapView(self.build_min_heap(nums[:]))
+
+    def max_heap_view(self, nums):
+        return HeapView(self.build_max_heap(nums[:]))
+
 # Task 2: BST to heap transformer
+# The in-order values of a BST are sorted, so they already form a min-heap, and reversed they
+# form a max-heap. One iterative traversal fills the heap array and no sifting is needed
 class bst_to_heap:
     def __init__(self, bst_root):
         self.bst_root = bst_root
 
     def bst_to_min_heap(self):
-        sorted_values = self.__in_order_traversal(self.bst_root)
-        heap_builder = HeapBuilder()
-        return heap_builder.min_heap(sorted_values) # Return built min heap
+        return HeapBuilder().heap_tree(self.min_heap_array()) # Return built min heap
 
     def bst_to_max_heap(self):
-        sorted_values = self.__in_order_traversal(self.bst_root)
-        heap_builder = HeapBuilder()
-        return heap_builder.max_heap(sorted_values) # Return built max heap
+        return HeapBuilder().heap_tree(self.max_heap_array()) # Return built max heap
+
+    # Min-heap array: the BST values in ascending (in-order) order
+    # Time = O(n) Space = O(n)
+    def min_heap_array(self):
+        return self.__in_order_traversal(self.bst_root)
 
+    # Max-heap array: the in-order values reversed in place
+    # Time = O(n) Space = O(n)
+    def max_heap_array(self):
+        values = self.__in_order_traversal(self.bst_root)
+        values.reverse()
+        return values
+
+    # Iterative in-order traversal with an explicit stack, appending straight into one list
+    # Time = O(n) Space = O(h) besides the result (h = height of the tree)
     def __in_order_traversal(self, node):
-        if node is None:
-            return []
-        return self.__in_order_traversal(node.left) + [node.data] + self.__in_order_traversal(node.right)
+        values = []
+        append = values.append
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        while True:
+            while node is not None: # Go as far left as possible
+                push(node)
+                node = node.left
+            if not stack:
+                return values
+            node = pop()
+            append(node.data)
+            node = node.right
 
 
-if __name__ == "__main__":
+# Iterative sift helpers for a min-heap kept in a flat list (children of i are 2i+1 and 2i+2)
+def _sift_up(heap, pos):
+    # Move heap[pos] up while it is smaller than its parent, shifting parents down into the hole
+    # Time = O(log n) Space = O(1)
+    item = heap[pos]
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        parent_item = heap[parent]
+        if not item < parent_item:
+            break
+        heap[pos] = parent_item
+        pos = parent
+    heap[pos] = item
+
+
+def _sift_down(heap, pos):
+    # Move heap[pos] down while a child is smaller, shifting the smaller child up into the hole
+    # Time = O(log n) Space = O(1)
+    n = len(heap)
+    item = heap[pos]
+    child = 2 * pos + 1
+    while child < n:
+        right = child + 1
+        if right < n and heap[right] < heap[child]:
+            child = right
+        child_item = heap[child]
+        if not child_item < item:
+            break
+        heap[pos] = child_item
+        pos = child
+        child = 2 * pos + 1
+    heap[pos] = item
+
+
+def _sift_up_keyed(keys, items, pos):
+    # _sift_up on parallel key/item lists, comparing keys only
+    # Time = O(log n) Space = O(1)
+    key = keys[pos]
+    item = items[pos]
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        parent_key = keys[parent]
+        if not key < parent_key:
+            break
+        keys[pos] = parent_key
+        items[pos] = items[parent]
+        pos = parent
+    keys[pos] = key
+    items[pos] = item
+
+
+def _sift_down_keyed(keys, items, pos):
+    # _sift_down on parallel key/item lists, comparing keys only
+    # Time = O(log n) Space = O(1)
+    n = len(keys)
+    key = keys[pos]
+    item = items[pos]
+    child = 2 * pos + 1
+    while child < n:
+        right = child + 1
+        if right < n and keys[right] < keys[child]:
+            child = right
+        child_key = keys[child]
+        if not child_key < key:
+            break
+        keys[pos] = child_key
+        items[pos] = items[child]
+        pos = child
+        child = 2 * pos + 1
+    keys[pos] = key
+    items[pos] = item
+
+
+# Priority queue: a min-heap kept in a flat list that supports inserts and extracts after it is built
+class PriorityQueue:
+    arity = 2 # Children per node
+    _sift_up = staticmethod(_sift_up)
+    _sift_down = staticmethod(_sift_down)
+    _sift_up_keyed = staticmethod(_sift_up_keyed)
+    _sift_down_keyed = staticmethod(_sift_down_keyed)
+
+    def __init__(self, items=None, key=None):
+        # key=None compares the items themselves. With a key function the keys are computed once per item
+        # and kept in a parallel list, so the items never need to be comparable. Items with equal keys
+        # come out in no particular order. For max-first order use a reversing key (e.g. key=lambda x: -x)
+        self.key = key
+        self._items = []
+        self._keys = [] if key is not None else None
+        if items is not None:
+            self.heapify(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __iter__(self):
+        # Items in heap (array) order, not sorted order
+        return iter(self._items)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._items!r})"
+
+    # Wrap a list that already is a heap (e.g. from HeapBuilder.build_min_heap or bst_to_heap.min_heap_array)
+    # without sifting again. The list is used as is, not copied. Extra options go to the constructor
+    # Time = O(1) without a key, O(n) with one Space = O(1) / O(n)
+    @classmethod
+    def from_heap(cls, heap, key=None, **options):
+        queue = cls(key=key, **options)
+        queue._items = heap
+        if key is not None:
+            queue._keys = [key(item) for item in heap]
+        return queue
+
+    # Replace the contents with items and restore the heap property bottom-up
+    # Time = O(n) Space = O(n)
+    def heapify(self, items):
+        self._items = list(items)
+        n = len(self._items)
+        if self.key is None:
+            heap = self._items
+            for i in range((n - 2) // self.arity, -1, -1): # Start from the last non-leaf node and go upwards
+                self._sift_down(heap, i)
+        else:
+            self._keys = [self.key(item) for item in self._items]
+            for i in range((n - 2) // self.arity, -1, -1):
+                self._sift_down_keyed(self._keys, self._items, i)
+
+    # Add an item
+    # Time = O(log n) Space = O(1) amortized
+    def push(self, item):
+        items = self._items
+        items.append(item)
+        if self.key is None:
+            self._sift_up(items, len(items) - 1)
+        else:
+            self._keys.append(self.key(item))
+            self._sift_up_keyed(self._keys, items, len(items) - 1)
+
+    # Smallest item without removing it
+    # Time = O(1) Space = O(1)
+    def peek(self):
+        if not self._items:
+            raise IndexError("peek from an empty priority queue")
+        return self._items[0]
+
+    # Remove and return the smallest item: the last leaf fills the root and is sifted down
+    # Time = O(log n) Space = O(1)
+    def pop(self):
+        items = self._items
+        if not items:
+            raise IndexError("pop from an empty priority queue")
+        last = items.pop()
+        if self.key is None:
+            if not items:
+                return last
+            smallest = items[0]
+            items[0] = last
+            self._sift_down(items, 0)
+        else:
+            keys = self._keys
+            last_key = keys.pop()
+            if not items:
+                return last
+            smallest = items[0]
+            items[0] = last
+            keys[0] = last_key
+            self._sift_down_keyed(keys, items, 0)
+        return smallest
+
+    # Push item, then pop the smallest. Returns item straight away when it would be the new root
+    # Time = O(log n) Space = O(1)
+    def pushpop(self, item):
+        items = self._items
+        if self.key is None:
+            if items and items[0] < item:
+                item, items[0] = items[0], item
+                self._sift_down(items, 0)
+            return item
+        key = self.key(item)
+        keys = self._keys
+        if items and keys[0] < key:
+            item, items[0] = items[0], item
+            keys[0] = key
+            self._sift_down_keyed(keys, items, 0)
+        return item
+
+    # Pop the smallest, then push item, in one sift. Unlike pushpop the returned item may be larger than item
+    # Time = O(log n) Space = O(1)
+    def replace(self, item):
+        items = self._items
+        if not items:
+            raise IndexError("replace on an empty priority queue")
+        smallest = items[0]
+        items[0] = item
+        if self.key is None:
+            self._sift_down(items, 0)
+        else:
+            self._keys[0] = self.key(item)
+            self._sift_down_keyed(self._keys, items, 0)
+        return smallest
+
+    def clear(self):
+        self._items = []
+        if self.key is not None:
+            self._keys = []
+
+    # Index-based view of the current heap (shares the list, so it follows later pushes and pops)
+    # Time = O(1) Space = O(1)
+    def view(self):
+        return HeapView(self._items)
+
+    # Tree of the current heap, built with HeapBuilder.heap_tree
+    # Time = O(n) Space = O(n)
+    def to_tree(self):
+        return HeapBuilder().heap_tree(self._items)
+
+
+# Sift helpers for a d-ary min-heap (children of i are d*i+1 .. d*i+d, parent is (i-1)//d),
+# created once per arity so the arity is a closure constant instead of an argument
+def _dary_sift_functions(arity):
+    def sift_up(heap, pos):
+        # Time = O(log_d n) Space = O(1)
+        item = heap[pos]
+        while pos > 0:
+            parent = (pos - 1) // arity
+            parent_item = heap[parent]
+            if not item < parent_item:
+                break
+            heap[pos] = parent_item
+            pos = parent
+        heap[pos] = item
+
+    def sift_down(heap, pos):
+        # The d children are contiguous, so the smallest is found with min() over a slice
+        # (one C-level scan) instead of a Python loop, then moved up into the hole
+        # Time = O(d log_d n) Space = O(d)
+        n = len(heap)
+        item = heap[pos]
+        child = arity * pos + 1
+        while child < n:
+            children = heap[child:child + arity]
+            smallest_item = min(children)
+            if not smallest_item < item:
+                break
+            heap[pos] = smallest_item
+            pos = child + children.index(smallest_item)
+            child = arity * pos + 1
+        heap[pos] = item
+
+    def sift_up_keyed(keys, items, pos):
+        # Time = O(log_d n) Space = O(1)
+        key = keys[pos]
+        item = items[pos]
+        while pos > 0:
+            parent = (pos - 1) // arity
+            parent_key = keys[parent]
+            if not key < parent_key:
+                break
+            keys[pos] = parent_key
+            items[pos] = items[parent]
+            pos = parent
+        keys[pos] = key
+        items[pos] = item
+
+    def sift_down_keyed(keys, items, pos):
+        # Time = O(d log_d n) Space = O(d)
+        n = len(keys)
+        key = keys[pos]
+        item = items[pos]
+        child = arity * pos + 1
+        while child < n:
+            children = keys[child:child + arity]
+            smallest_key = min(children)
+            if not smallest_key < key:
+                break
+            smallest = child + children.index(smallest_key)
+            keys[pos] = smallest_key
+            items[pos] = items[smallest]
+            pos = smallest
+            child = arity * pos + 1
+        keys[pos] = key
+        items[pos] = item
+
+    return sift_up, sift_down, sift_up_keyed, sift_down_keyed
+
+
+# d-ary heap: PriorityQueue with a configurable number of children per node. A larger arity makes
+# the tree shallower (cheaper push, since sift-up does one comparison per level) but makes every
+# sift-down level compare up to d children (dearer pop)
+class DaryHeap(PriorityQueue):
+    def __init__(self, items=None, key=None, arity=4):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        if arity != 2: # Arity 2 keeps PriorityQueue's binary sifts, which compare the two children directly
+            self._sift_up, self._sift_down, self._sift_up_keyed, self._sift_down_keyed = _dary_sift_functions(arity)
+        super().__init__(items, key)
+
+    def __repr__(self):
+        return f"DaryHeap({self._items!r}, arity={self.arity})"
+
+    # HeapView and heap_tree assume two children per node
+    def view(self):
+        if self.arity != 2:
+            raise TypeError("HeapView only supports binary heaps (arity 2)")
+        return super().view()
+
+    def to_tree(self):
+        if self.arity != 2:
+            raise TypeError("Node trees only support binary heaps (arity 2)")
+        return super().to_tree()
+
+
+# Streaming top-k selection: a heap of at most k entries holds the best items seen so far, and its
+# root is the worst of them, so each new item costs one comparison unless it displaces the root
+class _ReversedKey:
+    # Flips the ordering of a key so the min-heap sifts keep the largest key at the root (for nsmallest)
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def _select(k, iterable, key, largest):
+    # Shared body of nlargest/nsmallest. Heap keys are (key, arrival order) so that among equal keys the
+    # latest arrival is the one evicted, and ties come out in arrival order like
+    # sorted(iterable, key=key, reverse=largest)[:k]
+    # Time = O(n log k) Space = O(k)
+    if k <= 0:
+        return []
+    keys = []
+    items = []
+    iterator = iter(iterable)
+    for order, item in enumerate(iterator): # Fill the heap with the first k items
+        item_key = item if key is None else key(item)
+        keys.append((item_key, -order) if largest else _ReversedKey((item_key, order)))
+        items.append(item)
+        if order + 1 == k:
+            break
+    for i in range((len(keys) - 2) // 2, -1, -1):
+        _sift_down_keyed(keys, items, i)
+
+    if len(keys) == k:
+        order = k
+        worst = keys[0][0] if largest else keys[0].value[0]
+        for item in iterator:
+            item_key = item if key is None else key(item)
+            if (worst < item_key) if largest else (item_key < worst): # Better than the worst kept item
+                keys[0] = (item_key, -order) if largest else _ReversedKey((item_key, order))
+                items[0] = item
+                _sift_down_keyed(keys, items, 0)
+                worst = keys[0][0] if largest else keys[0].value[0]
+            order += 1
+
+    if largest:
+        ranked = sorted(range(len(keys)), key=keys.__getitem__, reverse=True)
+    else:
+        ranked = sorted(range(len(keys)), key=lambda i: keys[i].value)
+    return [items[i] for i in ranked]
+
+
+# The k largest items of any iterable, largest first, holding at most k items in memory
+# Time = O(n log k) Space = O(k)
+def nlargest(k, iterable, key=None):
+    return _select(k, iterable, key, largest=True)
+
+
+# The k smallest items of any iterable, smallest first, holding at most k items in memory
+# Time = O(n log k) Space = O(k)
+def nsmallest(k, iterable, key=None):
+    return _select(k, iterable, key, largest=False)
+
+
+# Handle returned by IndexedPriorityQueue.push: the entry's priority, its item and its current heap index
+class HeapHandle:
+    __slots__ = ('priority', 'item', 'index')
+
+    def __init__(self, priority, item, index):
+        self.priority = priority
+        self.item = item
+        self.index = index # Position in the heap list, -1 once the entry has left the queue
+
+    def __repr__(self):
+        return f"HeapHandle(priority={self.priority!r}, item={self.item!r})"
+
+
+# Indexed priority queue: a min-heap of handles, each storing its own heap index (the position map),
+# so an entry can be found, re-prioritised or removed without searching the heap
+class IndexedPriorityQueue:
+    def __init__(self, key=None):
+        # Priority of a pushed item when none is given: key(item), or the item itself
+        self.key = key
+        self._heap = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __contains__(self, handle):
+        return self._owns(handle)
+
+    def _owns(self, handle):
+        # Time = O(1) Space = O(1)
+        index = handle.index
+        return 0 <= index < len(self._heap) and self._heap[index] is handle
+
+    def _sift_up(self, pos):
+        # Time = O(log n) Space = O(1)
+        heap = self._heap
+        handle = heap[pos]
+        priority = handle.priority
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            parent_handle = heap[parent]
+            if not priority < parent_handle.priority:
+                break
+            heap[pos] = parent_handle
+            parent_handle.index = pos
+            pos = parent
+        heap[pos] = handle
+        handle.index = pos
+
+    def _sift_down(self, pos):
+        # Time = O(log n) Space = O(1)
+        heap = self._heap
+        n = len(heap)
+        handle = heap[pos]
+        priority = handle.priority
+        child = 2 * pos + 1
+        while child < n:
+            right = child + 1
+            if right < n and heap[right].priority < heap[child].priority:
+                child = right
+            child_handle = heap[child]
+            if not child_handle.priority < priority:
+                break
+            heap[pos] = child_handle
+            child_handle.index = pos
+            pos = child
+            child = 2 * pos + 1
+        heap[pos] = handle
+        handle.index = pos
+
+    # Add an item and return its handle
+    # Time = O(log n) Space = O(1) amortized
+    def push(self, item, priority=None):
+        if priority is None:
+            priority = self.key(item) if self.key is not None else item
+        handle = HeapHandle(priority, item, len(self._heap))
+        self._heap.append(handle)
+        self._sift_up(handle.index)
+        return handle
+
+    # Handle of the entry with the smallest priority, without removing it
+    # Time = O(1) Space = O(1)
+    def peek(self):
+        if not self._heap:
+            raise IndexError("peek from an empty priority queue")
+        return self._heap[0]
+
+    # Remove the entry with the smallest priority and return its item
+    # Time = O(log n) Space = O(1)
+    def pop(self):
+        return self.pop_handle().item
+
+    # Remove the entry with the smallest priority and return its handle
+    # Time = O(log n) Space = O(1)
+    def pop_handle(self):
+        heap = self._heap
+        if not heap:
+            raise IndexError("pop from an empty priority queue")
+        last = heap.pop()
+        if heap:
+            smallest = heap[0]
+            heap[0] = last
+            last.index = 0
+            self._sift_down(0)
+        else:
+            smallest = last
+        smallest.index = -1
+        return smallest
+
+    # Lower an entry's priority in place
+    # Time = O(log n) Space = O(1)
+    def decrease_key(self, handle, priority):
+        if not self._owns(handle):
+            raise ValueError("handle is not in this priority queue")
+        if handle.priority < priority:
+            raise ValueError("new priority is larger than the current one")
+        handle.priority = priority
+        self._sift_up(handle.index)
+
+    # Raise an entry's priority in place
+    # Time = O(log n) Space = O(1)
+    def increase_key(self, handle, priority):
+        if not self._owns(handle):
+            raise ValueError("handle is not in this priority queue")
+        if priority < handle.priority:
+            raise ValueError("new priority is smaller than the current one")
+        handle.priority = priority
+        self._sift_down(handle.index)
+
+    # Change an entry's priority in either direction
+    # Time = O(log n) Space = O(1)
+    def update(self, handle, priority):
+        if not self._owns(handle):
+            raise ValueError("handle is not in this priority queue")
+        old_priority = handle.priority
+        handle.priority = priority
+        if priority < old_priority:
+            self._sift_up(handle.index)
+        else:
+            self._sift_down(handle.index)
+
+    # Remove an entry anywhere in the heap and return its item: the last leaf fills the hole
+    # and moves up or down from there
+    # Time = O(log n) Space = O(1)
+    def remove(self, handle):
+        if not self._owns(handle):
+            raise ValueError("handle is not in this priority queue")
+        heap = self._heap
+        index = handle.index
+        last = heap.pop()
+        if last is not handle:
+            heap[index] = last
+            last.index = index
+            if last.priority < handle.priority:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        handle.index = -1
+        return handle.item
+
+    def clear(self):
+        for handle in self._heap:
+            handle.index = -1
+        self._heap = []
+
+
+# Node of a PairingHeap, also the handle push returns. Children form a list through child/sibling;
+# prev is the parent for a first child and the left sibling otherwise
+class PairingNode:
+    __slots__ = ('priority', 'item', 'child', 'sibling', 'prev', 'owner')
+
+    def __init__(self, priority, item, owner):
+        self.priority = priority
+        self.item = item
+        self.child = None
+        self.sibling = None
+        self.prev = None
+        self.owner = owner # _PairingOwner of the heap holding the node, None once it was removed
+
+    def __repr__(self):
+        return f"PairingNode(priority={self.priority!r}, item={self.item!r})"
+
+
+# Ownership token of a PairingHeap. meld forwards the emptied heap's token to the receiving heap's token,
+# so the handles it gave out resolve to their new heap without being visited
+class _PairingOwner:
+    __slots__ = ('forward',)
+
+    def __init__(self):
+        self.forward = None
+
+
+# Pairing heap: a mergeable min-heap kept as a tree of nodes instead of an array, so two heaps meld in O(1)
+# by linking their roots. pop restructures the root's children with the two-pass pairing
+class PairingHeap:
+    def __init__(self, items=None, key=None):
+        # Priority of a pushed item when none is given: key(item), or the item itself
+        self.key = key
+        self._root = None
+        self._size = 0
+        self._owner = _PairingOwner()
+        if items is not None:
+            for item in items:
+                self.push(item)
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._root is not None
+
+    # Make the root with the larger priority the first child of the other, and return the new root
+    # Time = O(1) Space = O(1)
+    def _link(self, first, second):
+        if second.priority < first.priority:
+            first, second = second, first
+        child = first.child
+        second.sibling = child
+        if child is not None:
+            child.prev = second
+        second.prev = first
+        first.child = second
+        return first
+
+    # Two-pass pairing of a sibling list: link neighbours left to right, then fold the pairs right to left
+    # Time = O(k) for k siblings, O(log n) amortized per pop Space = O(k)
+    def _merge_pairs(self, node):
+        pairs = []
+        while node is not None:
+            first = node
+            second = first.sibling
+            node = second.sibling if second is not None else None
+            first.sibling = first.prev = None
+            if second is not None:
+                second.sibling = second.prev = None
+                first = self._link(first, second)
+            pairs.append(first)
+        root = pairs.pop() if pairs else None
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+    # True if handle is an entry of this heap. The handle's token is followed through the forwarding
+    # left by meld, and the handle is pointed straight at the token it ends at for the next check
+    # Time = O(m) for m melds since the last check of this handle, O(1) after that Space = O(1)
+    def _owns(self, handle):
+        owner = handle.owner
+        if owner is None:
+            return False
+        while owner.forward is not None:
+            owner = owner.forward
+        handle.owner = owner
+        return owner is self._owner
+
+    # Unhook a non-root node (and its subtree) from its parent's child list
+    # Time = O(1) Space = O(1)
+    def _detach(self, node):
+        prev = node.prev
+        if prev.child is node:
+            prev.child = node.sibling
+        else:
+            prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = prev
+        node.prev = node.sibling = None
+
+    # Add an item and return its handle
+    # Time = O(1) Space = O(1)
+    def push(self, item, priority=None):
+        if priority is None:
+            priority = self.key(item) if self.key is not None else item
+        node = PairingNode(priority, item, self._owner)
+        self._root = node if self._root is None else self._link(self._root, node)
+        self._size += 1
+        return node
+
+    # Handle of the entry with the smallest priority, without removing it
+    # Time = O(1) Space = O(1)
+    def peek(self):
+        if self._root is None:
+            raise IndexError("peek from an empty pairing heap")
+        return self._root
+
+    # Remove the entry with the smallest priority and return its item
+    # Time = O(log n) amortized Space = O(log n)
+    def pop(self):
+        return self.pop_handle().item
+
+    def pop_handle(self):
+        root = self._root
+        if root is None:
+            raise IndexError("pop from an empty pairing heap")
+        self._root = self._merge_pairs(root.child)
+        root.child = None
+        root.owner = None
+        self._size -= 1
+        return root
+
+    # Move every entry of other into this heap; other is left empty. Handles from other stay valid here:
+    # other's token forwards to this heap's, and other starts over with a fresh token
+    # Time = O(1) Space = O(1)
+    def meld(self, other):
+        if other is self:
+            raise ValueError("cannot meld a heap with itself")
+        if other._root is not None:
+            self._root = other._root if self._root is None else self._link(self._root, other._root)
+            self._size += other._size
+        other._root = None
+        other._size = 0
+        other._owner.forward = self._owner
+        other._owner = _PairingOwner()
+        return self
+
+    # Lower an entry's priority: cut its subtree off and link it back at the root
+    # Time = O(1) (amortized o(log n)) Space = O(1)
+    def decrease_key(self, handle, priority):
+        if not self._owns(handle):
+            raise ValueError("handle is not in this pairing heap")
+        if handle.priority < priority:
+            raise ValueError("new priority is larger than the current one")
+        handle.priority = priority
+        if handle is not self._root:
+            self._detach(handle)
+            self._root = self._link(self._root, handle)
+
+    # Remove an entry anywhere in the heap and return its item: its children are paired into one subtree
+    # that is linked back at the root
+    # Time = O(log n) amortized Space = O(log n)
+    def remove(self, handle):
+        if not self._owns(handle):
+            raise ValueError("handle is not in this pairing heap")
+        if handle is self._root:
+            return self.pop()
+        self._detach(handle)
+        subtree = self._merge_pairs(handle.child)
+        handle.child = None
+        if subtree is not None:
+            self._root = self._link(self._root, subtree)
+        handle.owner = None
+        self._size -= 1
+        return handle.item
+
+
+# Demo, run with: python Heap.py (or python -m Heap)
+def main():
     # Define the print function to visualize the heap as a tree
     def print_heap(root):
         if root is None:
@@ -219,3 +1108,63 @@ if __name__ == "__main__":
     max_heap_from_bst_root = transformer.bst_to_max_heap()
     print("Max-Heap Tree Structure from BST:")
     print_heap(max_heap_from_bst_root)
+
+    # Priority queue: push/pop after the heap is built
+    print("-" * 75)
+    print("\nPriority Queue:")
+    queue = PriorityQueue(A)
+    print("Heapified:", list(queue))
+    queue.push(50)
+    print("After push(50), peek:", queue.peek())
+    print("pushpop(70):", queue.pushpop(70))
+    print("replace(90):", queue.replace(90))
+    print("Popped in order:", [queue.pop() for _ in range(len(queue))])
+
+    jobs = PriorityQueue([("backup", 3), ("email", 1), ("report", 2)], key=lambda job: job[1])
+    print("Jobs by priority:", [jobs.pop()[0] for _ in range(len(jobs))])
+
+    # Indexed priority queue: change or remove entries through their handles
+    print("\nIndexed Priority Queue:")
+    timers = IndexedPriorityQueue()
+    handles = {name: timers.push(name, deadline) for name, deadline in (("a", 30), ("b", 10), ("c", 20), ("d", 40))}
+    timers.decrease_key(handles["d"], 5)
+    timers.increase_key(handles["b"], 35)
+    timers.remove(handles["c"])
+    print("Timers by deadline:", [timers.pop() for _ in range(len(timers))])
+
+    # Pairing heap: meld two heaps in O(1)
+    print("\nPairing Heap:")
+    left_shard = PairingHeap([("backup", 3), ("email", 1)], key=lambda job: job[1])
+    right_shard = PairingHeap([("report", 2)], key=lambda job: job[1])
+    handle = right_shard.push(("deploy", 4))
+    left_shard.meld(right_shard) # right_shard is now empty, its handles work on left_shard
+    left_shard.decrease_key(handle, 0)
+    print("Melded jobs by priority:", [left_shard.pop()[0] for _ in range(len(left_shard))])
+
+    # d-ary heap: same API with more children per node
+    print("\nd-ary Heap (arity 4):")
+    dary = DaryHeap(A, arity=4)
+    dary.push(50)
+    print("Heap array:", list(dary))
+    print("Popped in order:", [dary.pop() for _ in range(len(dary))])
+
+    # Streaming top-k: only k items are ever held
+    print("\nTop-k of a stream of 1000 values:")
+    stream = ((value * 37) % 1000 for value in range(1000))
+    print("nlargest(3):", nlargest(3, stream))
+    print("nsmallest(3, key=last digit):", nsmallest(3, A, key=lambda value: value % 10))
+
+    # Heap view: walk the heap array as a tree without building nodes
+    print("-" * 75)
+    print("\nHeap View of the Min-Heap:")
+    view = heap_builder.min_heap_view(A)
+    print("Breadth-first:", list(view.bfs()))
+    print("Pre-order:", list(view.dfs('pre')))
+    print("In-order:", list(view.dfs('in')))
+    print("Post-order:", list(view.dfs('post')))
+    print("Children of the root:", [view.value(i) for i in view.children(view.root())])
+    print("Height:", view.height(), "Valid min-heap:", view.is_min_heap())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Vectorized heap construction and heapsort for NumPy numeric arrays
+# NumPy is optional: without it, or for any other input, the pure-Python HeapBuilder path is used
+try:
+    import numpy as np
+except ImportError: # Pure-Python fallback only
+    np = None
+
+from Heap import HeapBuilder, PriorityQueue
+
+
+# True if values is a NumPy array of integers or floats, the inputs the vectorized path handles
+# Time = O(1) Space = O(1)
+def is_numeric_array(values):
+    return np is not None and isinstance(values, np.ndarray) and values.ndim == 1 and values.dtype.kind in 'iuf'
+
+
+# Sift every node of one heap level down at the same time. The subtrees below one level are disjoint,
+# so all the swaps of one step touch different slots and can be done with fancy indexing
+# Time = O(height) vectorized steps Space = O(level size)
+def _sift_level_down(heap, start, stop, before):
+    n = len(heap)
+    pos = np.arange(start, stop)
+    while pos.size:
+        left = 2 * pos + 1
+        inside = left < n # pos is ascending, so the nodes that still have children come first
+        pos = pos[inside]
+        left = left[inside]
+        child = left
+        right = left + 1
+        has_right = right < n
+        if has_right.any():
+            child = left.copy()
+            right = right[has_right]
+            child[has_right] = np.where(before(heap[right], heap[left[has_right]]), right, left[has_right])
+        swap = before(heap[child], heap[pos]) # Child comes before its parent: swap and keep going down
+        pos = pos[swap]
+        child = child[swap]
+        heap[pos], heap[child] = heap[child], heap[pos]
+        pos = child
+
+
+# Floyd's bottom-up build, one level at a time from the last parent level up to the root.
+# Gives the same array as HeapBuilder.build_min_heap/build_max_heap
+# Time = O(n) work in O(log^2 n) vectorized steps Space = O(n)
+def _build_heap_vectorized(heap, max_heap):
+    before = np.greater if max_heap else np.less
+    last_parent = len(heap) // 2 - 1
+    if last_parent < 0:
+        return heap
+    for level in range((last_parent + 1).bit_length() - 1, -1, -1):
+        start = (1 << level) - 1
+        _sift_level_down(heap, start, min(2 * start + 1, last_parent + 1), before)
+    return heap
+
+
+# Rearrange values in place into a min-heap and return it (HeapBuilder.build_min_heap for other inputs)
+# Time = O(n) Space = O(n) for NumPy arrays, O(log n) otherwise
+def build_min_heap(values):
+    if is_numeric_array(values):
+        return _build_heap_vectorized(values, max_heap=False)
+    return HeapBuilder().build_min_heap(values)
+
+
+def build_max_heap(values):
+    if is_numeric_array(values):
+        return _build_heap_vectorized(values, max_heap=True)
+    return HeapBuilder().build_max_heap(values)
+
+
+# Sorted copy of values through a heap. The build is vectorized for NumPy arrays; extraction is inherently
+# one root at a time, so it pops from a PriorityQueue over the heap as a Python list, which is faster
+# than indexing NumPy scalars, and writes the results into an array of the same dtype
+# Time = O(n log n) Space = O(n)
+def heapsort(values, reverse=False):
+    if is_numeric_array(values):
+        queue = PriorityQueue.from_heap(_build_heap_vectorized(values.copy(), max_heap=False).tolist())
+        result = np.fromiter((queue.pop() for _ in range(len(values))), dtype=values.dtype, count=len(values))
+        return result[::-1].copy() if reverse else result
+    queue = PriorityQueue(values)
+    result = [queue.pop() for _ in range(len(queue))]
+    if reverse:
+        result.reverse()
+    return result
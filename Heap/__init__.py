@@ -0,0 +1,39 @@
+# Heap package
+# Importing the package does no work: each submodule is imported the first time
+# one of its names is used (e.g. Heap.HeapBuilder), and the demos only run through main() / python -m Heap
+import importlib
+
+# Submodule -> public names it provides
+_SUBMODULES = {
+    'Heap': (
+        'HeapBuilder', 'BST', 'Node', 'bst_to_heap', 'PriorityQueue',
+        'IndexedPriorityQueue', 'HeapHandle', 'HeapView', 'DaryHeap',
+        'nlargest', 'nsmallest', 'PairingHeap', 'PairingNode', 'main',
+    ),
+    'ExternalSort': (
+        'ExternalSorter', 'external_sort', 'merge',
+    ),
+    'NumericHeap': (
+        'build_min_heap', 'build_max_heap', 'heapsort', 'is_numeric_array',
+    ),
+    'AsyncQueue': (
+        'AsyncPriorityQueue',
+    ),
+}
+_LAZY_NAMES = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = sorted(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    # Time = O(1) after the first use of a submodule's names
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+# Run the demo: python -m Heap
+from .Heap import main
+
+main()
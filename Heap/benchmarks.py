@@ -0,0 +1,590 @@
+# Benchmarks for the heap implementations
+# Run from this folder: python benchmarks.py
+import asyncio
+import heapq
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from Heap import (BST, DaryHeap, HeapBuilder, HeapView, Node, bst_to_heap, PriorityQueue, IndexedPriorityQueue,
+                  PairingHeap, nlargest, nsmallest)
+from AsyncQueue import AsyncPriorityQueue
+from ExternalSort import ExternalSorter
+import NumericHeap
+
+
+def best_time(function, repeat=3):
+    # Best wall time (seconds) of function() over repeat runs
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark_priority_queue(n=200000, seed=1):
+    # heapify, push, pop and pushpop of PriorityQueue against heapq on the same random floats
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(n)]
+
+    def queue_heapify():
+        PriorityQueue(values)
+
+    def heapq_heapify():
+        heapq.heapify(values[:])
+
+    def builder_heapify():
+        HeapBuilder().build_min_heap(values[:])
+
+    def queue_push_pop():
+        queue = PriorityQueue()
+        for value in values:
+            queue.push(value)
+        while queue:
+            queue.pop()
+
+    def heapq_push_pop():
+        heap = []
+        for value in values:
+            heapq.heappush(heap, value)
+        while heap:
+            heapq.heappop(heap)
+
+    def queue_pushpop():
+        queue = PriorityQueue(values[:1000])
+        for value in values:
+            queue.pushpop(value)
+
+    def heapq_pushpop():
+        heap = values[:1000]
+        heapq.heapify(heap)
+        for value in values:
+            heapq.heappushpop(heap, value)
+
+    print(f"{n} random floats, best of 3 (s)")
+    print(f"{'operation':<22}{'PriorityQueue':>15}{'heapq':>10}{'ratio':>8}")
+    rows = (('heapify', queue_heapify, heapq_heapify),
+            ('push all, pop all', queue_push_pop, heapq_push_pop),
+            ('pushpop (k=1000)', queue_pushpop, heapq_pushpop))
+    for name, ours, reference in rows:
+        ours_time = best_time(ours)
+        reference_time = best_time(reference)
+        print(f"{name:<22}{ours_time:>15.3f}{reference_time:>10.3f}{ours_time / reference_time:>7.1f}x")
+    print(f"{'heapify (HeapBuilder)':<22}{best_time(builder_heapify):>15.3f}")
+
+
+def benchmark_job_scheduler(jobs=200000, ready=1000, seed=1):
+    # Scheduler loop: keep `ready` jobs queued, repeatedly run the most urgent one and enqueue a new one.
+    # PriorityQueue uses key=; heapq needs (priority, counter, job) tuples so jobs are never compared
+    rng = random.Random(seed)
+    priorities = [rng.randrange(100) for _ in range(jobs + ready)]
+    job_list = [{'id': i, 'priority': priority} for i, priority in enumerate(priorities)]
+
+    def queue_scheduler():
+        queue = PriorityQueue(job_list[:ready], key=lambda job: job['priority'])
+        for job in job_list[ready:]:
+            queue.replace(job)
+
+    def heapq_scheduler():
+        heap = [(job['priority'], job['id'], job) for job in job_list[:ready]]
+        heapq.heapify(heap)
+        for job in job_list[ready:]:
+            heapq.heapreplace(heap, (job['priority'], job['id'], job))
+
+    ours_time = best_time(queue_scheduler)
+    reference_time = best_time(heapq_scheduler)
+    print(f"{jobs} jobs through a queue of {ready}")
+    print(f"{'PriorityQueue (key=)':<26}{ours_time:>8.3f} s  {jobs / ours_time:>12,.0f} jobs/s")
+    print(f"{'heapq (tuples)':<26}{reference_time:>8.3f} s  {jobs / reference_time:>12,.0f} jobs/s")
+
+
+def random_graph(nodes, edges_per_node, max_weight=100, seed=1):
+    # Directed graph as adjacency lists of (neighbour, weight); node i links to i+1 so every node is reachable
+    rng = random.Random(seed)
+    graph = [[] for _ in range(nodes)]
+    for node in range(nodes):
+        if node + 1 < nodes:
+            graph[node].append((node + 1, rng.randint(1, max_weight)))
+        for _ in range(edges_per_node - 1):
+            graph[node].append((rng.randrange(nodes), rng.randint(1, max_weight)))
+    return graph
+
+
+def dijkstra_indexed(graph, source):
+    # One heap entry per node, lowered in place with decrease_key
+    # Time = O((V + E) log V) Space = O(V)
+    distances = [None] * len(graph)
+    distances[source] = 0
+    queue = IndexedPriorityQueue()
+    handles = {source: queue.push(source, 0)}
+    while queue:
+        handle = queue.pop_handle()
+        node, distance = handle.item, handle.priority
+        for neighbour, weight in graph[node]:
+            candidate = distance + weight
+            known = distances[neighbour]
+            if known is None:
+                distances[neighbour] = candidate
+                handles[neighbour] = queue.push(neighbour, candidate)
+            elif candidate < known:
+                distances[neighbour] = candidate
+                queue.decrease_key(handles[neighbour], candidate)
+    return distances
+
+
+def dijkstra_lazy(graph, source):
+    # Lazy deletion: push a new (distance, node) entry on every improvement and skip stale ones when popped
+    # Time = O(E log E) Space = O(E)
+    distances = [None] * len(graph)
+    distances[source] = 0
+    queue = PriorityQueue([(0, source)])
+    while queue:
+        distance, node = queue.pop()
+        if distance > distances[node]:
+            continue # Stale entry
+        for neighbour, weight in graph[node]:
+            candidate = distance + weight
+            known = distances[neighbour]
+            if known is None or candidate < known:
+                distances[neighbour] = candidate
+                queue.push((candidate, neighbour))
+    return distances
+
+
+def dijkstra_heapq(graph, source):
+    # dijkstra_lazy on heapq, as a reference
+    distances = [None] * len(graph)
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        for neighbour, weight in graph[node]:
+            candidate = distance + weight
+            known = distances[neighbour]
+            if known is None or candidate < known:
+                distances[neighbour] = candidate
+                heapq.heappush(heap, (candidate, neighbour))
+    return distances
+
+
+def benchmark_dijkstra(nodes=200000, edges_per_node=5):
+    # Shortest paths from node 0 with decrease_key against lazy deletion
+    graph = random_graph(nodes, edges_per_node)
+    print(f"{nodes} nodes, {nodes * edges_per_node} edges")
+    expected = None
+    for name, dijkstra in (('IndexedPriorityQueue', dijkstra_indexed), ('PriorityQueue (lazy)', dijkstra_lazy),
+                           ('heapq (lazy)', dijkstra_heapq)):
+        start = time.perf_counter()
+        distances = dijkstra(graph, 0)
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = distances
+        assert distances == expected
+        print(f"{name:<24}{elapsed:>8.3f} s")
+
+
+def list_queue_heap_tree(nums):
+    # The original HeapBuilder.heap_tree: a Python list used as a FIFO queue with pop(0)
+    if not nums:
+        return None
+    root = Node(nums[0])
+    queue = [root]
+    i = 1
+    while i < len(nums):
+        curr_node = queue.pop(0)
+        if i < len(nums):
+            curr_node.left = Node(nums[i])
+            queue.append(curr_node.left)
+            i += 1
+        if i < len(nums):
+            curr_node.right = Node(nums[i])
+            queue.append(curr_node.right)
+            i += 1
+    return root
+
+
+def node_tree_preorder(root):
+    # Pre-order walk of a Node tree, the way callers walked heap_tree results
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node.data
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+
+def benchmark_heap_views(sizes=(10000, 50000, 200000), seed=1):
+    # Time to get something walkable from a heap list, and to walk it in pre-order
+    rng = random.Random(seed)
+    print(f"{'n':>8}{'pop(0) tree':>13}{'heap_tree':>11}{'view':>10}{'tree walk':>11}{'view walk':>11}  (s)")
+    for n in sizes:
+        heap = HeapBuilder().build_min_heap([rng.random() for _ in range(n)])
+        # The pop(0) version is quadratic, so it is skipped on the largest input
+        old_build = best_time(lambda: list_queue_heap_tree(heap), repeat=1) if n <= 50000 else None
+        new_build = best_time(lambda: HeapBuilder().heap_tree(heap))
+        view_build = best_time(lambda: HeapView(heap))
+        root = HeapBuilder().heap_tree(heap)
+        view = HeapView(heap)
+        tree_walk = best_time(lambda: sum(1 for _ in node_tree_preorder(root)))
+        view_walk = best_time(lambda: sum(1 for _ in view.dfs('pre')))
+        old_text = f"{old_build:>13.3f}" if old_build is not None else f"{'-':>13}"
+        print(f"{n:>8}{old_text}{new_build:>11.3f}{view_build:>10.6f}{tree_walk:>11.3f}{view_walk:>11.3f}")
+
+
+def concatenating_in_order(node):
+    # The original bst_to_heap traversal: recursive, rebuilding the list at every level
+    if node is None:
+        return []
+    return concatenating_in_order(node.left) + [node.data] + concatenating_in_order(node.right)
+
+
+def build_bst(values):
+    # BST with the same shape BST.insert gives, built iteratively
+    bst = BST()
+    for value in values:
+        if bst.root is None:
+            bst.root = Node(value)
+            continue
+        node = bst.root
+        while True:
+            if value <= node.data:
+                if node.left is None:
+                    node.left = Node(value)
+                    break
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = Node(value)
+                    break
+                node = node.right
+    return bst
+
+
+def degenerate_bst(n):
+    # BST of 0..n-1 inserted in ascending order: a chain of right children
+    bst = BST()
+    node = None
+    for value in range(n):
+        child = Node(value)
+        if node is None:
+            bst.root = child
+        else:
+            node.right = child
+        node = child
+    return bst
+
+
+def benchmark_bst_to_heap(seed=1):
+    # Heap arrays from a BST: the original traversal plus build_min_heap/build_max_heap on a copy,
+    # against one iterative traversal that already is a heap
+    rng = random.Random(seed)
+    random_values = list(range(200000))
+    rng.shuffle(random_values)
+    cases = (('random, n=200000', build_bst(random_values)), ('degenerate, n=900', degenerate_bst(900)),
+             ('degenerate, n=200000', degenerate_bst(200000)))
+    print(f"{'tree':<24}{'heap':<6}{'original (s)':>16}{'iterative (s)':>15}")
+    for name, bst in cases:
+        transformer = bst_to_heap(bst.root)
+        for heap, build, convert in (('min', HeapBuilder().build_min_heap, transformer.min_heap_array),
+                                     ('max', HeapBuilder().build_max_heap, transformer.max_heap_array)):
+            try:
+                original = best_time(lambda: build(concatenating_in_order(bst.root)[:]))
+                original_text = f"{original:>16.3f}"
+            except RecursionError:
+                original_text = f"{'RecursionError':>16}"
+            print(f"{name:<24}{heap:<6}{original_text}{best_time(convert):>15.3f}")
+
+def benchmark_dary_heap(arities=(2, 4, 8, 16), sizes=(10 ** 4, 10 ** 5, 10 ** 6), seed=1):
+    # Build, push-heavy and pop-heavy times of DaryHeap for every arity and input size.
+    # The request's full sweep goes up to 10 ** 7 (pass sizes=(..., 10 ** 7)); that takes minutes per arity
+    rng = random.Random(seed)
+    print(f"{'n':>10}{'arity':>7}{'build (s)':>11}{'push n (s)':>12}{'pop n (s)':>11}")
+    for n in sizes:
+        values = [rng.random() for _ in range(n)]
+        repeat = 3 if n <= 10 ** 5 else 1
+        for arity in arities:
+            build = best_time(lambda: DaryHeap(values, arity=arity), repeat)
+
+            def push_all():
+                heap = DaryHeap(arity=arity)
+                for value in values:
+                    heap.push(value)
+
+            def pop_all():
+                heap = DaryHeap(values, arity=arity)
+                for _ in range(n):
+                    heap.pop()
+
+            push = best_time(push_all, repeat)
+            pop = best_time(pop_all, repeat) - build # Only the pops
+            print(f"{n:>10}{arity:>7}{build:>11.3f}{push:>12.3f}{pop:>11.3f}")
+
+
+def random_stream(n, seed=1):
+    # n random floats, generated lazily so the stream itself holds nothing
+    rng = random.Random(seed)
+    return (rng.random() for _ in range(n))
+
+
+def benchmark_top_k(n=10 ** 6, k=100):
+    # Top k of a stream: time, throughput and peak traced memory of each approach.
+    # Memory is measured in a separate run because tracing slows everything down
+    def full_sort():
+        return sorted(random_stream(n), reverse=True)[:k]
+
+    def heap_builder():
+        # Materialise, build a max-heap, then take the top k from a copy of it
+        heap = HeapBuilder().build_max_heap(list(random_stream(n)))
+        return nlargest(k, heap)
+
+    approaches = (('nlargest', lambda: nlargest(k, random_stream(n))),
+                  ('heapq.nlargest', lambda: heapq.nlargest(k, random_stream(n))),
+                  ('sorted()[:k]', full_sort),
+                  ('build_max_heap', heap_builder))
+    expected = full_sort()
+    print(f"top {k} of {n} random floats")
+    print(f"{'approach':<18}{'time (s)':>10}{'items/s':>14}{'peak memory':>14}")
+    for name, approach in approaches:
+        start = time.perf_counter()
+        result = approach()
+        elapsed = time.perf_counter() - start
+        assert result == expected
+
+        tracemalloc.start()
+        approach()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:<18}{elapsed:>10.3f}{n / elapsed:>14,.0f}{peak / 2 ** 20:>11.2f} MB")
+
+    start = time.perf_counter()
+    nsmallest(k, random_stream(n), key=lambda value: abs(value - 0.5))
+    elapsed = time.perf_counter() - start
+    print(f"{'nsmallest (key=)':<18}{elapsed:>10.3f}{n / elapsed:>14,.0f}")
+
+
+def write_student_records(path, n, seed=1):
+    # n insert records in the fixed-width format Tree.BST.read_data reads (43 bytes per line)
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    with open(path, 'w') as records:
+        for _ in range(n):
+            name = rng.choice(letters).upper() + ''.join(rng.choice(letters) for _ in range(rng.randint(3, 11)))
+            records.write(f"I{rng.randrange(10 ** 7):07d}{name:<25}{rng.randrange(10000):04d}"
+                          f"{rng.choice(('CT', 'JA', 'RST', 'RFM')):<4}{rng.randint(1, 4)}\n")
+
+
+def student_name(line):
+    return line[8:33].strip()
+
+
+def benchmark_external_sort(n=500000, memory_limits=(4 * 2 ** 20, 16 * 2 ** 20)):
+    # Sort a student record file by name: in memory with sorted() against ExternalSorter with a memory budget.
+    # Peak memory is traced in a separate run
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, 'students.txt')
+        output_path = os.path.join(directory, 'sorted.txt')
+        write_student_records(input_path, n)
+        print(f"{n} student records, {os.path.getsize(input_path) / 2 ** 20:.1f} MB, sorted by name")
+        print(f"{'approach':<24}{'time (s)':>10}{'runs':>6}{'passes':>8}{'peak memory':>14}")
+
+        def in_memory():
+            with open(input_path) as records, open(output_path, 'w') as output:
+                output.writelines(sorted(records, key=student_name))
+
+        with open(input_path) as records:
+            expected = sorted(records, key=student_name)
+        approaches = [('sorted() in memory', in_memory, None)]
+        for memory_limit in memory_limits:
+            sorter = ExternalSorter(key=student_name, memory_limit=memory_limit)
+            approaches.append((f"ExternalSorter {memory_limit // 2 ** 20} MB",
+                               lambda sorter=sorter: sorter.sort_file(input_path, output_path), sorter))
+
+        for name, approach, sorter in approaches:
+            start = time.perf_counter()
+            approach()
+            elapsed = time.perf_counter() - start
+            with open(output_path) as output:
+                assert output.readlines() == expected
+
+            tracemalloc.start()
+            approach()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            runs = f"{sorter.runs_written:>6}{sorter.merge_passes:>8}" if sorter else f"{'-':>6}{'-':>8}"
+            print(f"{name:<24}{elapsed:>10.3f}{runs}{peak / 2 ** 20:>11.1f} MB")
+
+
+def benchmark_numeric_heap(sizes=(10 ** 6, 10 ** 7), heapsort_size=10 ** 6, seed=1):
+    # Min-heap build of random int64 values: HeapBuilder on a list against the level-wise vectorized build,
+    # then heapsort against np.sort. Needs NumPy
+    np = NumericHeap.np
+    if np is None:
+        print("NumPy is not installed, skipping")
+        return
+    rng = np.random.default_rng(seed)
+    print(f"{'n':>10}{'HeapBuilder (s)':>17}{'heapq (s)':>11}{'vectorized (s)':>16}{'speed-up':>10}")
+    for n in sizes:
+        values = rng.integers(0, 2 ** 31, n)
+        as_list = values.tolist()
+        builder = best_time(lambda: HeapBuilder().build_min_heap(as_list[:]), repeat=1)
+        reference = best_time(lambda: heapq.heapify(as_list[:]), repeat=1)
+        vectorized = best_time(lambda: NumericHeap.build_min_heap(values.copy()))
+        assert NumericHeap.build_min_heap(values.copy()).tolist() == HeapBuilder().build_min_heap(as_list[:])
+        print(f"{n:>10}{builder:>17.3f}{reference:>11.3f}{vectorized:>16.3f}{builder / vectorized:>9.1f}x")
+
+    values = rng.integers(0, 2 ** 31, heapsort_size)
+    heapsort = best_time(lambda: NumericHeap.heapsort(values), repeat=1)
+    numpy_sort = best_time(lambda: np.sort(values))
+    print(f"heapsort of {heapsort_size}: {heapsort:.3f} s (np.sort: {numpy_sort:.3f} s)")
+
+
+def benchmark_meld(shards=1000, per_shard=200, pops_per_merge=5, seed=1):
+    # Sharded scheduler: merge shards pairwise until one queue is left, popping a few jobs after every merge.
+    # PairingHeap.meld against the rebuild approach (concatenate the lists, then build a heap again)
+    rng = random.Random(seed)
+    shard_values = [[rng.random() for _ in range(per_shard)] for _ in range(shards)]
+
+    def tournament(heaps, merge, pop):
+        # Merge neighbours round by round; returns everything popped
+        popped = []
+        while len(heaps) > 1:
+            merged = []
+            for i in range(0, len(heaps) - 1, 2):
+                heap = merge(heaps[i], heaps[i + 1])
+                for _ in range(pops_per_merge):
+                    popped.append(pop(heap))
+                merged.append(heap)
+            if len(heaps) % 2:
+                merged.append(heaps[-1])
+            heaps = merged
+        return popped
+
+    builder = HeapBuilder()
+
+    def builder_pop(heap):
+        # HeapBuilder has no pop: move the last leaf to the root and heapify from there
+        smallest = heap[0]
+        heap[0] = heap[-1]
+        heap.pop()
+        builder.heapify_min(heap, len(heap), 0)
+        return smallest
+
+    # name, build one shard, merge two shards, pop
+    approaches = (('PairingHeap.meld', PairingHeap, lambda first, second: first.meld(second), PairingHeap.pop),
+                  ('HeapBuilder rebuild', lambda values: builder.build_min_heap(values[:]),
+                   lambda first, second: builder.build_min_heap(first + second), builder_pop),
+                  ('PriorityQueue rebuild', PriorityQueue,
+                   lambda first, second: PriorityQueue(first._items + second._items), PriorityQueue.pop))
+
+    print(f"{shards} shards of {per_shard} jobs merged pairwise, {pops_per_merge} pops per merge")
+    print(f"{'approach':<24}{'build (s)':>10}{'merge + pop (s)':>17}")
+    expected = None
+    for name, build, merge, pop in approaches:
+        start = time.perf_counter()
+        heaps = [build(values) for values in shard_values]
+        built = time.perf_counter()
+        popped = tournament(heaps, merge, pop)
+        merged = time.perf_counter()
+        expected = popped if expected is None else expected
+        assert popped == expected
+        print(f"{name:<24}{built - start:>10.3f}{merged - built:>17.3f}")
+
+def benchmark_async_queue(items=100000, task_counts=((1, 1), (10, 10), (100, 100)), maxsize=1000, seed=1):
+    # Items per second through a bounded queue with many producer and consumer tasks.
+    # AsyncPriorityQueue (get and get_many) against asyncio.PriorityQueue with (priority, counter, item) tuples
+    rng = random.Random(seed)
+    priorities = [rng.random() for _ in range(items)]
+
+    async def run(producers, consumers, make_queue, put, consume):
+        queue = make_queue()
+        share = items // producers
+
+        async def producer(start):
+            for i in range(start, start + share):
+                await put(queue, i, priorities[i])
+
+        received = [0]
+
+        async def consumer():
+            while True:
+                received[0] += await consume(queue)
+
+        consumer_tasks = [asyncio.create_task(consumer()) for _ in range(consumers)]
+        start = time.perf_counter()
+        await asyncio.gather(*(producer(p * share) for p in range(producers)))
+        while received[0] < share * producers:
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - start
+        for task in consumer_tasks:
+            task.cancel()
+        await asyncio.gather(*consumer_tasks, return_exceptions=True)
+        return share * producers / elapsed
+
+    async def ours_put(queue, item, priority):
+        await queue.put(item, priority)
+
+    async def ours_get(queue):
+        await queue.get()
+        return 1
+
+    async def ours_get_many(queue):
+        return len(await queue.get_many(64))
+
+    async def asyncio_put(queue, item, priority):
+        await queue.put((priority, item, item))
+
+    async def asyncio_get(queue):
+        await queue.get()
+        return 1
+
+    approaches = (('AsyncPriorityQueue.get', lambda: AsyncPriorityQueue(maxsize), ours_put, ours_get),
+                  ('AsyncPriorityQueue.get_many', lambda: AsyncPriorityQueue(maxsize), ours_put, ours_get_many),
+                  ('asyncio.PriorityQueue', lambda: asyncio.PriorityQueue(maxsize), asyncio_put, asyncio_get))
+    print(f"{items} items, maxsize {maxsize}, items/s")
+    print(f"{'approach':<30}" + ''.join(f"{f'{p}p/{c}c':>12}" for p, c in task_counts))
+    for name, make_queue, put, consume in approaches:
+        rates = [asyncio.run(run(producers, consumers, make_queue, put, consume)) for producers, consumers in task_counts]
+        print(f"{name:<30}" + ''.join(f"{rate:>12,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    print('\n-------Priority queue vs heapq--------')
+    benchmark_priority_queue()
+
+    print('\n-------Job scheduler--------')
+    benchmark_job_scheduler()
+
+    print('\n-------Dijkstra: decrease-key vs lazy deletion--------')
+    benchmark_dijkstra()
+
+    print('\n-------Heap views vs Node trees--------')
+    benchmark_heap_views()
+
+    print('\n-------BST to heap--------')
+    benchmark_bst_to_heap()
+
+    print('\n-------d-ary heap: arity sweep--------')
+    benchmark_dary_heap()
+
+    print('\n-------Streaming top-k--------')
+    benchmark_top_k()
+
+    print('\n-------External merge sort--------')
+    benchmark_external_sort()
+
+    print('\n-------Vectorized heap build (NumPy)--------')
+    benchmark_numeric_heap()
+
+    print('\n-------Mergeable heaps: meld vs rebuild--------')
+    benchmark_meld()
+
+    print('\n-------asyncio priority queue--------')
+    benchmark_async_queue()
@@ -343,8 +343,6 @@ def test_users_sorted_by_id():
         current = current.next
 
 
-test_users_sorted_by_id()
-
 # Task 2: Add a new user with a unique ID that is either one more than the last ID or the first available ID.
 def test_add_new_user():
     bank = Bank_of_Orange_County()
@@ -376,9 +374,6 @@ def test_add_new_user():
     bank.print_user_details()
 
 
-test_add_new_user()
-
-
 # Task 4: Testing the pay_user_to_user function by letting the payer be ID 1 and payee ID 3:
 def test_pay_user_to_user():
     bank = Bank_of_Orange_County()
@@ -413,9 +408,6 @@ def test_pay_user_to_user():
         print("Transaction failed.")
 
 
-test_pay_user_to_user()
-
-
 # Task 5: Testing median ID on both odd and even number of users
 def test_get_median_id():
     bank = Bank_of_Orange_County()
@@ -439,9 +431,6 @@ def test_get_median_id():
     print(f"Median User ID (Even): {median_id}")
 
 
-test_get_median_id()
-
-
 # Task 6: Merging two accounts into one
 def test_merge_accounts():
     print("\n--- Task 6 ---\n")
@@ -467,9 +456,6 @@ def test_merge_accounts():
         print("An error occurred: Merged account not found.")
 
 
-test_merge_accounts()
-
-
 # Task 7: Merge two banks into one
 def test_merge_banks():
     print("\n--- Task 7 ---\n")
@@ -495,4 +481,15 @@ def test_merge_banks():
     merged_bank.print_users_in_sorted_order()
 
 
-test_merge_banks()
+# Demo, run with: python LinkedList_Array.py (or python -m LinkedList_Array)
+def main():
+    test_users_sorted_by_id()
+    test_add_new_user()
+    test_pay_user_to_user()
+    test_get_median_id()
+    test_merge_accounts()
+    test_merge_banks()
+
+
+if __name__ == "__main__":
+    main()
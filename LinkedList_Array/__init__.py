@@ -0,0 +1,29 @@
+# Linked list (bank accounts) package
+# Importing the package does no work: each submodule is imported the first time
+# one of its names is used (e.g. LinkedList_Array.Bank_of_Orange_County), and the demos only run through main() / python -m LinkedList_Array
+import importlib
+
+# Submodule -> public names it provides
+_SUBMODULES = {
+    'LinkedList_Array': (
+        'linked_list', 'AccountNode', 'Bank_of_Orange_County', 'Bank_of_Los_Angeles',
+        'Bank_of_Southern_California', 'main',
+    ),
+}
+_LAZY_NAMES = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = sorted(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    # Time = O(1) after the first use of a submodule's names
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+# Run the demo: python -m LinkedList_Array
+from .LinkedList_Array import main
+
+main()
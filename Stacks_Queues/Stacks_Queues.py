@@ -211,8 +211,6 @@ def test_player_stack():
     top_player = stack.peek()
 
 
-test_player_stack()
-
 # Test case Task 2
 def test_evaluate():
     print("\n-------- TASK 2: Evaluate Expression --------\n")
@@ -238,8 +236,6 @@ def test_evaluate():
         print("-" * 25)
 
 
-test_evaluate()
-
 # Task 3: Implementing a queue from scratch
 class Node:
     def __init__(self, player=None):
@@ -345,8 +341,6 @@ def test_queue():
     print(f"Polled Player: {top_player}")
 
 
-test_queue()
-
 # Task 4: Stack Implementation Using Two Queues
 class StackWithTwoQs:
     def __init__(self):
@@ -425,5 +419,13 @@ def test_stack_with_two_qs():
     print(f"Stack Size after popping the last element: {stack.size()}")
 
 
+# Demo, run with: python Stacks_Queues.py (or python -m Stacks_Queues)
+def main():
+    test_player_stack()
+    test_evaluate()
+    test_queue()
+    test_stack_with_two_qs()
+
 
-test_stack_with_two_qs()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+# Run the demo: python -m Stacks_Queues
+from .Stacks_Queues import main
+
+main()
@@ -1,4 +1,5 @@
 # Assignment 4: Tree
+import os
 
 # Task 1: Build Binary Search Tree (BST) using tree input data
 
@@ -156,15 +157,22 @@ class BST:
         except IOError as e:
             print(f"An exception occurred while writing to the file: {e}")
 
-if __name__ == "__main__":
+# Demo, run with: python Tree.py (or python -m Tree)
+def main():
+    # Input and output files live next to this script
+    folder = os.path.dirname(os.path.abspath(__file__))
     bst = BST()
-    bst.read_data("tree-input.txt")
+    bst.read_data(os.path.join(folder, "tree-input.txt"))
 
     # Task 2: In-order traversal and write to file
     print("\n-------Task 2-------")
-    bst.write_in_order(bst.root, "in_order_traversal.txt")
+    bst.write_in_order(bst.root, os.path.join(folder, "in_order_traversal.txt"))
 
 
     # Task 3: Breadth-first traversal and write to file
     print("\n-------Task 3-------")
-    bst.breadth_first("breadth_first.txt")
+    bst.breadth_first(os.path.join(folder, "breadth_first.txt"))
+
+
+if __name__ == "__main__":
+    main()
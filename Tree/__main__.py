@@ -0,0 +1,4 @@
+# Run the demo: python -m Tree
+from .Tree import main
+
+main()
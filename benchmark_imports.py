@@ -0,0 +1,57 @@
+# Cold-import cost of every package, measured in a fresh interpreter per run
+# Run from the repository root: python benchmark_imports.py
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Package -> (module, a public name, whether importing the module used to run its demo)
+PACKAGES = {
+    'Hashtable': ('Hashtable.Hashtable', 'HashTable', True),
+    'Heap': ('Heap.Heap', 'HeapBuilder', False),
+    'LinkedList_Array': ('LinkedList_Array.LinkedList_Array', 'Bank_of_Orange_County', True),
+    'Stacks_Queues': ('Stacks_Queues.Stacks_Queues', 'Stack', True),
+    'Tree': ('Tree.Tree', 'BST', False),
+}
+
+# Child process: time only the statement, not the interpreter start-up
+TIMER = '''
+import contextlib, importlib, io, time
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+def time_statement(statement, runs):
+    # Best wall time (seconds) of the statement over runs fresh interpreters
+    code = TIMER.format(statement='\n'.join('    ' + line for line in statement.splitlines()))
+    best = None
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout
+        elapsed = float(output.strip().splitlines()[-1])
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark_imports(runs=5):
+    # before: what "import module" cost when the demo ran at import time
+    # package: import the package (nothing is loaded yet)
+    # first use: import the package and touch one name, which loads its submodule
+    print(f"Best of {runs} cold imports (ms)")
+    print(f"{'package':<18}{'before':>10}{'package':>10}{'first use':>11}")
+    for package, (module, name, demo_at_import) in PACKAGES.items():
+        before_statement = f"module = importlib.import_module({module!r})"
+        if demo_at_import:
+            before_statement += "\nmodule.main()"
+        before = time_statement(before_statement, runs)
+        package_only = time_statement(f"import {package}", runs)
+        first_use = time_statement(f"import {package}\n{package}.{name}", runs)
+        print(f"{package:<18}{before * 1000:>10.2f}{package_only * 1000:>10.2f}{first_use * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    benchmark_imports()